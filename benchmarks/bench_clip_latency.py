@@ -0,0 +1,111 @@
+import contextlib
+import io
+import math
+import os
+import random
+import struct
+import tempfile
+import threading
+import time
+import wave
+
+from macrodeck.AudioSinks import WavFileSink
+from macrodeck.ClipCache import ClipCache, ClipPlayer
+from macrodeck.PlayerBackends import HAS_VLC
+
+# measures trigger-to-first-sample latency of PlayMedia's paths, p50/p99 over TRIGGERS presses
+#   cached      clip already decoded in a ClipCache, played through an open sink
+#   decoded     same sink, but the clip is decoded on every press (what the cache saves)
+#   libvlc      media_new + play until libvlc reports Playing (only if python-vlc is installed;
+#               a lower bound, since it doesn't include libvlc's own output buffering)
+# the sink is a realtime WavFileSink, so no sound card is needed
+# run from the repo root: python -m benchmarks.bench_clip_latency
+
+NCLIPS = 20
+CLIP_SECONDS = 3.0
+CLIP_RATE = 44100  # not the sink's rate, so decoding has to resample too
+TRIGGERS = 200
+
+
+def write_clips(folder):
+    paths = []
+    for i in range(NCLIPS):
+        path = os.path.join(folder, f"clip{i}.wav")
+        nframes = int(CLIP_SECONDS * CLIP_RATE)
+        tone = 220 * (i + 1)
+        samples = [
+            int(8000 * math.sin(2 * math.pi * tone * t / CLIP_RATE))
+            for t in range(nframes)
+        ]
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(CLIP_RATE)
+            f.writeframes(struct.pack(f"<{nframes}h", *samples))
+        paths.append(path)
+    return paths
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def bench_clips(player, paths, cold):
+    block = player.sink.blocksize / player.sink.rate
+    samples = []
+    for i in range(TRIGGERS):
+        if cold:
+            player.cache.clips.clear()
+            player.cache.nbytes = 0
+        # press at a random point between blocks
+        time.sleep(random.uniform(0, 2 * block))
+        player.play(paths[i % len(paths)])
+        while player.first_sample is None:
+            time.sleep(0.0001)
+        samples.append(player.first_sample - player.triggered)
+    return samples
+
+
+def bench_vlc(paths):
+    import vlc
+
+    instance = vlc.Instance("--aout=dummy")
+    player = instance.media_player_new()
+    started = threading.Event()
+    player.event_manager().event_attach(
+        vlc.EventType.MediaPlayerPlaying, lambda event: started.set()
+    )
+
+    samples = []
+    for i in range(TRIGGERS):
+        started.clear()
+        triggered = time.perf_counter()
+        player.set_media(instance.media_new(paths[i % len(paths)]))
+        player.play()
+        started.wait()
+        samples.append(time.perf_counter() - triggered)
+        player.stop()
+    return samples
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        paths = write_clips(folder)
+        sink = WavFileSink(os.path.join(folder, "out.wav"), realtime=True)
+        player = ClipPlayer(sink, ClipCache(sink.rate, sink.channels))
+
+        with contextlib.redirect_stdout(io.StringIO()):  # "Playing ..." on every press
+            results = {"decoded": bench_clips(player, paths, cold=True)}
+            results["cached"] = bench_clips(player, paths, cold=False)
+        player.close()
+        if HAS_VLC:
+            results["libvlc"] = bench_vlc(paths)
+
+    block_ms = sink.blocksize / sink.rate * 1e3
+    print(f"{TRIGGERS} triggers, sink block = {block_ms:.1f} ms")
+    print(f"{'path':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, samples in results.items():
+        p50 = percentile(samples, 0.5) * 1e3
+        p99 = percentile(samples, 0.99) * 1e3
+        print(f"{name:>10} {p50:>8.2f} {p99:>8.2f}")
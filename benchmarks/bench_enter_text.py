@@ -0,0 +1,66 @@
+import time
+
+from macrodeck import Keyboard
+
+# measures EnterText throughput in characters per second, by text length
+#   per key     the old way: keyboard.type, one SendInput call per key press and release
+#   chunked     keyboard.type_text: one SendInput call per TYPE_CHUNK characters
+#   auto        keyboard.enter_text: chunked typing, or a clipboard paste for long text
+# SendInput is simulated by a fake controller that spins for CALL_US per call plus EVENT_US per
+# key event, roughly what a call costs with a low level keyboard hook installed. pasting costs
+# PASTE_SETTLE, the wait before the clipboard is restored. no real keyboard is touched
+# run from the repo root: python -m benchmarks.bench_enter_text
+# (on linux without a display, set PYNPUT_BACKEND=dummy)
+
+LENGTHS = (20, 200, 2000, 8000)
+CALL_US = 50
+EVENT_US = 2
+
+
+def spin(us):
+    end = time.perf_counter() + us / 1e6
+    while time.perf_counter() < end:
+        pass
+
+
+class FakeKeyboard(Keyboard.keyboard):
+    def _handle(self, key, is_press):
+        spin(CALL_US + EVENT_US)
+
+    def send_text(self, text):
+        if text:
+            spin(CALL_US + 2 * len(text) * EVENT_US)
+
+
+class FakeClipboard:
+    def __init__(self):
+        self.text = "saved"
+
+    def get(self):
+        return self.text
+
+    def set(self, text):
+        self.text = text
+
+
+def bench(enter, text):
+    start = time.perf_counter()
+    enter(text)
+    return len(text) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    keyboard = FakeKeyboard()
+    clipboard = FakeClipboard()
+    modes = {
+        "per key": keyboard.type,
+        "chunked": keyboard.type_text,
+        "auto": lambda text: keyboard.enter_text(text, clipboard),
+    }
+    print(f"SendInput: {CALL_US} us per call + {EVENT_US} us per key event")
+    print(f"{'chars':>6} " + " ".join(f"{name + ' /s':>11}" for name in modes))
+    for length in LENGTHS:
+        text = ("lorem ipsum dolor sit amet\n" * (length // 27 + 1))[:length]
+        rates = [bench(enter, text) for enter in modes.values()]
+        print(f"{length:>6} " + " ".join(f"{rate:>11.0f}" for rate in rates))
+        assert clipboard.text == "saved"
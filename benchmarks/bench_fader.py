@@ -0,0 +1,33 @@
+import time
+
+from macrodeck.Fader import Fader
+
+# measures the CPU cost of running N simultaneous fades on one Fader
+# every ramp is updated on the same tick, so cost should barely grow with N
+# run from the repo root: python -m benchmarks.bench_fader
+
+FADES = (1, 10, 50, 200)
+SECONDS = 2.0
+
+
+def bench(fader, nfades):
+    calls = [0]
+
+    def setter(volume):
+        calls[0] += 1
+
+    start = time.process_time()
+    for i in range(nfades):
+        fader.ramp(i, setter, 0, 100, SECONDS)
+    while fader.active():
+        time.sleep(0.05)
+    return time.process_time() - start, calls[0]
+
+
+if __name__ == "__main__":
+    fader = Fader()
+    print(f"{SECONDS:g} s fades, tick = {fader.tick * 1e3:.0f} ms")
+    print(f"{'fades':>6} {'cpu ms':>8} {'setter calls':>12}")
+    for n in FADES:
+        cpu, calls = bench(fader, n)
+        print(f"{n:>6} {cpu * 1e3:>8.1f} {calls:>12}")
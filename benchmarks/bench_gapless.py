@@ -0,0 +1,81 @@
+import contextlib
+import io
+import queue
+import threading
+import time
+
+from macrodeck.PlayerBackends import FakeBackend
+from macrodeck.VLCPlayer import VLCPlayer
+
+# measures the gap between one playlist track ending and the next one playing, p50/p99 over TRACKS
+# tracks, on a FakeBackend so only VLCPlayer's own work is timed
+#   direct      end of media handled on the thread that reported it
+#   dispatched  ends are handed to another thread first, the way VLCBackend does it
+# also checks every track played once and in order, so a handoff that skips one fails loudly
+# run from the repo root: python -m benchmarks.bench_gapless
+
+TRACKS = 2000
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def played(backend):
+    # paths the default player started, in order
+    return [arg for _, method, arg in backend.log if method == "play"]
+
+
+def bench(paths, dispatched):
+    backend = FakeBackend()
+    player = VLCPlayer(backend=backend)
+    ends = queue.SimpleQueue()
+
+    def dispatch():
+        while ends.get():
+            backend.finish()
+
+    thread = threading.Thread(target=dispatch, daemon=True, name="Fake Events")
+    thread.start()
+
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):  # "Playing ..." on every track
+        player.play_playlist(paths)
+        for path in paths[1:]:
+            ended = time.perf_counter()
+            if dispatched:
+                ends.put(True)
+            else:
+                backend.finish()
+            while not (
+                player.default_player().path == path
+                and player.default_player().playing()
+            ):
+                if time.perf_counter() - ended > 1:
+                    raise AssertionError(
+                        f"{path} didn't start, playing {player.default_player().path}"
+                    )
+                time.sleep(0)
+            samples.append(time.perf_counter() - ended)
+    ends.put(False)
+    thread.join()
+
+    if played(backend) != paths:
+        raise AssertionError(f"tracks played out of order: {played(backend)[:10]} ...")
+    return samples
+
+
+if __name__ == "__main__":
+    paths = [f"track{i}.mp3" for i in range(TRACKS)]
+    results = {
+        "direct": bench(paths, dispatched=False),
+        "dispatched": bench(paths, dispatched=True),
+    }
+
+    print(f"{TRACKS} tracks")
+    print(f"{'ends':>10} {'p50 us':>8} {'p99 us':>8}")
+    for name, samples in results.items():
+        p50 = percentile(samples, 0.5) * 1e6
+        p99 = percentile(samples, 0.99) * 1e6
+        print(f"{name:>10} {p50:>8.1f} {p99:>8.1f}")
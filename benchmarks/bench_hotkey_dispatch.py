@@ -0,0 +1,78 @@
+import itertools
+import random
+import time
+
+from pynput.keyboard import KeyCode
+
+from macrodeck.Keyboard import MyGlobalHotKeys
+
+# measures the cost of one key event in MyGlobalHotKeys by number of registered hotkeys
+#   indexed     what _on_press/_on_release do: one lookup, then only the hotkeys using that key
+#   scan        the old way: canonicalize and check every hotkey
+# most events are keys typed into other applications that no hotkey uses; 1 in 20 is a hotkey
+# the listener is never started, so no keyboard hook is installed
+# run from the repo root: python -m benchmarks.bench_hotkey_dispatch
+# (on linux without a display, set PYNPUT_BACKEND=dummy)
+
+HOTKEYS = (17, 50, 100, 250, 500)
+EVENTS = 20000
+MODIFIER_VKS = (16, 17, 18, 91)  # shift, ctrl, alt, win
+HOTKEY_VKS = tuple(range(96, 106)) + tuple(range(112, 136))  # numpad 0-9, F1-F24
+TYPED = "abcdefghijklmnopqrstuvwxyz 0123456789"
+
+
+def hotkey_map(n):
+    # n distinct combos of modifiers + a function or numpad key, fewest modifiers first
+    combos = [
+        combo
+        for size in range(len(MODIFIER_VKS) + 1)
+        for combo in itertools.combinations(MODIFIER_VKS, size)
+    ]
+    hotkeys = {}
+    for combo in combos:
+        for vk in HOTKEY_VKS:
+            if len(hotkeys) == n:
+                return hotkeys
+            hotkeys["+".join(f"<{key}>" for key in combo + (vk,))] = lambda: None
+    raise ValueError(f"can't make {n} distinct hotkeys")
+
+
+def events(rng):
+    keys = []
+    for _ in range(EVENTS):
+        if rng.random() < 0.05:
+            keys.append(KeyCode.from_vk(rng.choice(HOTKEY_VKS)))
+        else:
+            keys.append(KeyCode.from_char(rng.choice(TYPED)))
+    return keys
+
+
+def scan_press(listener, key):
+    for hotkey in listener._hotkeys:
+        hotkey.press(listener.canonical_key(key))
+
+
+def scan_release(listener, key):
+    for hotkey in listener._hotkeys:
+        hotkey.release(listener.canonical_key(key))
+
+
+def bench(press, release, listener, keys):
+    start = time.perf_counter()
+    for key in keys:
+        press(listener, key)
+        release(listener, key)
+    return (time.perf_counter() - start) / (2 * len(keys))
+
+
+if __name__ == "__main__":
+    keys = events(random.Random(0))
+    print(f"{EVENTS * 2} events per run")
+    print(f"{'hotkeys':>7} {'indexed us':>10} {'scan us':>8}")
+    for n in HOTKEYS:
+        listener = MyGlobalHotKeys(hotkey_map(n))
+        indexed = bench(
+            MyGlobalHotKeys._on_press, MyGlobalHotKeys._on_release, listener, keys
+        )
+        scan = bench(scan_press, scan_release, listener, keys)
+        print(f"{n:>7} {indexed * 1e6:>10.2f} {scan * 1e6:>8.2f}")
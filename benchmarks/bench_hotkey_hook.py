@@ -0,0 +1,62 @@
+import time
+
+from pynput.keyboard import KeyCode
+
+from macrodeck.Keyboard import MyGlobalHotKeys, MyHotKey, parse_hotkey
+
+# measures how long the keyboard hook is held up by one hotkey press, by how long its action takes
+#   queued      what MyGlobalHotKeys does: the hook hands the action to the dispatch thread
+#   direct      the old way: the action runs inside the hook
+# the listener is never started, so no keyboard hook is installed
+# run from the repo root: python -m benchmarks.bench_hotkey_hook
+# (on linux without a display, set PYNPUT_BACKEND=dummy)
+
+ACTION_MS = (0, 1, 10, 50)
+PRESSES = 20
+HOTKEY = "<17>+<124>"  # ctrl+F13
+KEYS = (KeyCode.from_vk(17), KeyCode.from_vk(124))
+
+
+def action(ms):
+    def run():
+        time.sleep(ms / 1e3)
+
+    return run
+
+
+def press(on_press, on_release):
+    # returns the longest a single event took, in seconds
+    longest = 0.0
+    for key in KEYS:
+        start = time.perf_counter()
+        on_press(key)
+        longest = max(longest, time.perf_counter() - start)
+    for key in KEYS:
+        start = time.perf_counter()
+        on_release(key)
+        longest = max(longest, time.perf_counter() - start)
+    return longest
+
+
+def bench_queued(ms):
+    listener = MyGlobalHotKeys({HOTKEY: action(ms)})
+    longest = max(
+        press(listener._on_press, listener._on_release) for _ in range(PRESSES)
+    )
+    listener._dispatcher.stop()
+    listener._dispatcher.thread.join()
+    return longest
+
+
+def bench_direct(ms):
+    hotkey = MyHotKey(parse_hotkey(HOTKEY), action(ms))
+    return max(press(hotkey.press, hotkey.release) for _ in range(PRESSES))
+
+
+if __name__ == "__main__":
+    print(f"{PRESSES} presses of {HOTKEY}, longest event")
+    print(f"{'action ms':>9} {'queued us':>10} {'direct us':>10}")
+    for ms in ACTION_MS:
+        queued = bench_queued(ms)
+        direct = bench_direct(ms)
+        print(f"{ms:>9} {queued * 1e6:>10.1f} {direct * 1e6:>10.1f}")
@@ -0,0 +1,38 @@
+import random
+import time
+
+from macrodeck.MediaLibrary import Library
+
+# measures Library.song_from_index cost as the number of folders grows
+# run from the repo root: python -m benchmarks.bench_library_lookup
+
+FOLDER_COUNTS = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+SONGS_PER_FOLDER = 3
+LOOKUPS = 100_000
+
+
+def synthetic_library(nfolders, songs_per_folder=SONGS_PER_FOLDER):
+    lib = Library("music")
+    names = [f"track{i}.mp3" for i in range(songs_per_folder)]
+    for i in range(nfolders):
+        lib[f"folder{i}"] = names
+    lib.finalize()
+    return lib
+
+
+def bench(nfolders):
+    lib = synthetic_library(nfolders)
+    ixs = [random.randrange(lib.nsongs) for _ in range(LOOKUPS)]
+
+    start = time.perf_counter()
+    for ix in ixs:
+        lib.song_from_index(ix)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / LOOKUPS * 1e9  # ns per lookup
+
+
+if __name__ == "__main__":
+    print(f"{'folders':>10} {'ns/lookup':>10}")
+    for nfolders in FOLDER_COUNTS:
+        print(f"{nfolders:>10} {bench(nfolders):>10.0f}")
@@ -0,0 +1,70 @@
+import gc
+import random
+import time
+import tracemalloc
+
+from macrodeck.MediaLibrary import Library
+
+# compares memory used by Library.lib as dict of lists vs. Library.compact()
+# run from the repo root: python -m benchmarks.bench_library_memory
+
+NFOLDERS = 20_000
+SONGS_PER_FOLDER = 50  # 1M tracks
+LOOKUPS = 100_000
+
+
+def synthetic_library():
+    lib = Library("music")
+    for i in range(NFOLDERS):
+        key = f"artist{i // 10}/album{i % 10}"
+        lib[key] = [
+            f"{j:02d} - track title {i}-{j}.mp3" for j in range(SONGS_PER_FOLDER)
+        ]
+    lib.finalize()
+    return lib
+
+
+def traced_size(baseline):
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] - baseline
+
+
+def lookup_ns(lib):
+    ixs = [random.randrange(lib.nsongs) for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    for ix in ixs:
+        lib.song_from_index(ix)
+    return (time.perf_counter() - start) / LOOKUPS * 1e9
+
+
+if __name__ == "__main__":
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    lib = synthetic_library()
+    # don't count the cumulative index; it's the same for both
+    index_size = (
+        lib.index.__sizeof__()
+        + lib.keys.__sizeof__()
+        + lib.key2ix.__sizeof__()
+        + sum(key.__sizeof__() for key in lib.keys)
+    )
+    dict_size = traced_size(baseline) - index_size
+    tracemalloc.stop()
+    dict_ns = lookup_ns(lib)
+
+    # restarting tracemalloc forgets the old lists, so only the compact store is counted
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    lib.compact()
+    compact_size = traced_size(baseline)
+    tracemalloc.stop()
+    compact_ns = lookup_ns(lib)
+
+    print(f"{lib.nsongs} tracks in {NFOLDERS} folders")
+    print(f"{'':>12} {'MB':>8} {'bytes/track':>12} {'ns/lookup':>10}")
+    for name, size, ns in (
+        ("dict/list", dict_size, dict_ns),
+        ("compact", compact_size, compact_ns),
+    ):
+        print(f"{name:>12} {size / 1e6:>8.1f} {size / lib.nsongs:>12.1f} {ns:>10.0f}")
@@ -0,0 +1,79 @@
+import random
+import time
+
+from macrodeck.LibraryQuery import QueryIndex
+from macrodeck.MediaLibrary import Library
+from macrodeck.MediaTags import TagStore
+
+# measures LibraryQuery build and query times over a synthetic 1M track library
+# run from the repo root: python -m benchmarks.bench_library_query
+
+NFOLDERS = 20_000
+SONGS_PER_FOLDER = 50  # 1M tracks
+ARTISTS = 5_000
+REPEATS = 5
+
+QUERIES = [
+    "folder under sfx",
+    "duration < 10s",
+    "duration < 10s AND folder under sfx/",
+    "artist = artist42",
+    "artist = artist42 OR artist = artist43",
+    "track_gain > -3 AND duration >= 2m AND folder under music/a100",
+    "artist ~ 42",
+    "NOT folder under sfx",
+]
+
+
+def synthetic_library():
+    lib = Library("music")
+    lib[""] = []
+    lib["sfx"] = []
+    lib["music"] = []
+    for i in range(NFOLDERS):
+        top = "sfx" if i % 4 == 0 else "music"
+        lib[f"{top}/a{i // 10}"] = []
+        lib[f"{top}/a{i // 10}/b{i % 10}"] = [
+            f"track{j}.mp3" for j in range(SONGS_PER_FOLDER)
+        ]
+    lib.finalize()
+    return lib
+
+
+def synthetic_tags(lib):
+    store = TagStore(":memory:")
+    rnd = random.Random(0)
+    store.put_many(
+        (
+            path,
+            0,
+            {
+                "duration": rnd.uniform(0.1, 600),
+                "artist": f"artist{rnd.randrange(ARTISTS)}",
+                "track_gain": rnd.uniform(-12, 0),
+            },
+        )
+        for path in lib.songs()
+    )
+    return store
+
+
+def bench(index, query):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = index.select(query)
+    return len(result), (time.perf_counter() - start) / REPEATS * 1e3
+
+
+if __name__ == "__main__":
+    lib = synthetic_library()
+    store = synthetic_tags(lib)
+
+    start = time.perf_counter()
+    index = QueryIndex(lib, store)
+    print(f"{lib.nsongs} tracks, index built in {time.perf_counter() - start:.1f} s")
+
+    print(f"{'matches':>8} {'ms':>8}  query")
+    for query in QUERIES:
+        matches, ms = bench(index, query)
+        print(f"{matches:>8} {ms:>8.2f}  {query}")
@@ -0,0 +1,62 @@
+import random
+import string
+import time
+
+from macrodeck.LibrarySearch import SearchIndex
+from macrodeck.MediaLibrary import Library
+
+# measures SearchIndex latency per keystroke over a synthetic 500k file library
+# run from the repo root: python -m benchmarks.bench_library_search
+
+NFOLDERS = 5_000
+SONGS_PER_FOLDER = 100  # 500k files
+VOCABULARY = 3_000
+TYPED_QUERIES = 300
+
+
+def random_word(rnd):
+    return "".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 9)))
+
+
+def synthetic_library(rnd, words):
+    lib = Library("clips")
+    lib[""] = []
+    for i in range(NFOLDERS):
+        lib[f"{rnd.choice(words)} {i}"] = [
+            f"{' '.join(rnd.choices(words, k=rnd.randint(1, 4)))} {j:03d}.wav"
+            for j in range(SONGS_PER_FOLDER)
+        ]
+    lib.finalize()
+    return lib
+
+
+def percentile(samples, p):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+if __name__ == "__main__":
+    rnd = random.Random(0)
+    words = [random_word(rnd) for _ in range(VOCABULARY)]
+    lib = synthetic_library(rnd, words)
+
+    index = SearchIndex(lib)
+    start = time.perf_counter()
+    index.build()
+    print(f"{lib.nsongs} files, index built in {time.perf_counter() - start:.1f} s")
+
+    # type out queries one key at a time, like the search box does
+    samples = []
+    for _ in range(TYPED_QUERIES):
+        query = " ".join(rnd.choices(words, k=rnd.randint(1, 2)))
+        if rnd.random() < 0.2:  # typo
+            i = rnd.randrange(len(query))
+            query = query[:i] + rnd.choice(string.ascii_lowercase) + query[i + 1 :]
+        for i in range(1, len(query) + 1):
+            start = time.perf_counter()
+            index.search(query[:i])
+            samples.append((time.perf_counter() - start) * 1e3)
+
+    print(f"{len(samples)} keystrokes")
+    for p in (0.5, 0.9, 0.99, 1.0):
+        print(f"p{int(p * 100):<3} {percentile(samples, p):>8.2f} ms")
@@ -0,0 +1,100 @@
+import queue
+import statistics
+import threading
+import time
+
+from pynput._util import win32_vks
+from pynput.keyboard import KeyCode
+
+from macrodeck import Keyboard
+
+# measures how long a macro takes from the hotkey firing to its last key reaching the keyboard hook
+#   compiled    what Macro does: keys compiled when configured, then keyboard.send_macro,
+#               which waits on held keys and delivery instead of sleeping
+#   old         split + eval the key names on every run, fixed 0.1 s sleeps before and after
+# keys are sent through a fake controller whose "hook" hands them to a MyGlobalHotKeys listener
+# on another thread, HOOK_DELAY_MS after they're sent, translated the way the windows hook reports
+# them (see hook_key). no real keyboard is touched
+# run from the repo root: python -m benchmarks.bench_macro_latency
+# (on linux without a display, set PYNPUT_BACKEND=dummy)
+
+RUNS = 20
+HOOK_DELAY_MS = 0.2
+KEYSET = ("CONTROL+SHIFT", "<F13>")
+# SendInput takes the generic modifier codes, the low level hook reports the left/right ones
+HOOK_VKS = {
+    win32_vks.SHIFT: win32_vks.LSHIFT,
+    win32_vks.CONTROL: win32_vks.LCONTROL,
+    win32_vks.MENU: win32_vks.LMENU,
+}
+
+
+class FakeKeyboard(Keyboard.keyboard):
+    def __init__(self, listener):
+        super().__init__()
+        self.listener = listener
+        self.events = queue.SimpleQueue()
+        self.delivered = threading.Event()
+        threading.Thread(target=self.hook, daemon=True).start()
+
+    def _handle(self, key, is_press):
+        self.events.put((time.perf_counter() + HOOK_DELAY_MS / 1e3, key, is_press))
+
+    def hook(self):
+        while True:
+            deadline, key, is_press = self.events.get()
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+            key = hook_key(key)
+            if is_press:
+                self.listener._on_press(key)
+            else:
+                self.listener._on_release(key)
+                if key == hook_key(self.last):
+                    self.delivered.set()
+
+
+def hook_key(key):
+    # the key as the windows hook would report it
+    vk = getattr(key, "vk", None)
+    if vk in HOOK_VKS:
+        return KeyCode.from_vk(HOOK_VKS[vk])
+    return key
+
+
+def old_run_macro(keyboard, keyset):
+    time.sleep(0.1)
+    keys = [key for key in keyset if len(key) > 0]
+    keys = [
+        key if len(key) == 1 else KeyCode.from_vk(eval(f"win32_vks.{key.upper()}"))
+        for seq in keys
+        for key in seq.replace("<", "").replace(">", "").split("+")
+    ]
+    keyboard.press_keys(keys)
+    time.sleep(0.1)
+
+
+def bench(run, keyboard):
+    times = []
+    for _ in range(RUNS):
+        keyboard.delivered.clear()
+        start = time.perf_counter()
+        run()
+        keyboard.delivered.wait()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), max(times)
+
+
+if __name__ == "__main__":
+    listener = Keyboard.MyGlobalHotKeys({})
+    keyboard = FakeKeyboard(listener)
+    keys = Keyboard.compile_macro(*KEYSET)
+    keyboard.last = keys[-1]
+
+    results = {
+        "compiled": bench(lambda: keyboard.send_macro(keys, listener), keyboard),
+        "old": bench(lambda: old_run_macro(keyboard, KEYSET), keyboard),
+    }
+    print(f"{RUNS} runs of {'+'.join(KEYSET)}, hook delay {HOOK_DELAY_MS:g} ms")
+    print(f"{'macro':>9} {'median ms':>10} {'max ms':>8}")
+    for name, (median, longest) in results.items():
+        print(f"{name:>9} {median * 1e3:>10.2f} {longest * 1e3:>8.2f}")
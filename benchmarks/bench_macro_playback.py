@@ -0,0 +1,74 @@
+import random
+import statistics
+import time
+
+from pynput.keyboard import Controller
+
+from macrodeck import MacroRecorder
+
+# measures how far recorded macro playback drifts from the recorded timing, by playback speed
+#   deadline    what MacroRecorder.play does: each event at start + total delay, spinning the last 2 ms
+#   sleep       the naive way: time.sleep(delta) before each event, so every late wakeup adds up
+# error is when each key was sent minus when it should have been, relative to the first event.
+# keys go to a fake controller that only timestamps them, no real keyboard is touched
+# run from the repo root: python -m benchmarks.bench_macro_playback
+# (on linux without a display, set PYNPUT_BACKEND=dummy)
+
+EVENTS = 120
+SPEEDS = (0.5, 1.0, 2.0, 4.0)
+DELAY_MS = (2, 40)  # range of recorded delays between events, like fast typing
+
+
+class FakeController(Controller):
+    def __init__(self):
+        super().__init__()
+        self.times = []
+
+    def _handle(self, key, is_press):
+        self.times.append(time.perf_counter())
+
+
+def recording(rng):
+    events = []
+    for i in range(EVENTS // 2):
+        key = "abcdefghijklmnopqrstuvwxyz"[i % 26]
+        events.append([rng.randint(*DELAY_MS) * 1000, key, True])
+        events.append([rng.randint(*DELAY_MS) * 1000, key, False])
+    events[0][0] = 0
+    return MacroRecorder.compile_recording(events)
+
+
+def sleep_play(events, keyboard, speed):
+    for delta_us, key, is_press in events:
+        time.sleep(delta_us / 1e6 / speed)
+        if is_press:
+            keyboard.press(key)
+        else:
+            keyboard.release(key)
+
+
+def errors(events, times, speed):
+    # returns |sent - scheduled| of each event in us
+    elapsed_us = 0
+    result = []
+    for (delta_us, _, _), sent in zip(events, times):
+        elapsed_us += delta_us
+        result.append(abs((sent - times[0]) * 1e6 - elapsed_us / speed))
+    return result
+
+
+def bench(play, events, speed):
+    keyboard = FakeController()
+    play(events, keyboard, speed)
+    errs = sorted(errors(events, keyboard.times, speed))
+    return statistics.median(errs), errs[int(len(errs) * 0.95)], errs[-1]
+
+
+if __name__ == "__main__":
+    events = recording(random.Random(0))
+    print(f"{EVENTS} events, {DELAY_MS[0]}-{DELAY_MS[1]} ms apart, error in us")
+    print(f"{'speed':>5} {'mode':>8} {'median':>8} {'p95':>8} {'max':>9}")
+    for speed in SPEEDS:
+        for name, play in (("deadline", MacroRecorder.play), ("sleep", sleep_play)):
+            median, p95, worst = bench(play, events, speed)
+            print(f"{speed:>5g} {name:>8} {median:>8.0f} {p95:>8.0f} {worst:>9.0f}")
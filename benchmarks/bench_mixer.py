@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+import soundfile
+
+from macrodeck.AudioSinks import WavFileSink
+from macrodeck.ClipCache import ClipCache
+from macrodeck.Mixer import Mixer
+
+# measures how long Mixer.read takes to mix one sink block, by number of overlapping voices
+# one voice is streamed music (ducked while effects play), the rest are cached effects
+# a block has to be mixed well within its own duration or the sound card underruns
+# run from the repo root: python -m benchmarks.bench_mixer
+
+VOICES = (1, 2, 4, 8, 16, 32)
+BLOCKS = 2000
+CLIP_SECONDS = 30.0  # long enough that no voice finishes mid-run
+
+
+def write_clip(path, rate, seconds, tone):
+    t = np.arange(int(seconds * rate)) / rate
+    data = 0.1 * np.sin(2 * np.pi * tone * t).astype(np.float32)
+    soundfile.write(path, data, rate)
+
+
+def bench(mixer, sink, music, effect, nvoices):
+    mixer.stop()
+    mixer.play(music, music=True)
+    for _ in range(nvoices - 1):
+        mixer.play(effect)
+
+    block = sink.blocksize
+    samples = []
+    for _ in range(BLOCKS):
+        start = time.perf_counter()
+        mixer.read(block)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        music = os.path.join(folder, "music.flac")
+        effect = os.path.join(folder, "effect.wav")
+        write_clip(music, 44100, CLIP_SECONDS, 220)
+        write_clip(effect, 48000, CLIP_SECONDS, 440)
+
+        # not realtime: the benchmark pulls blocks itself
+        sink = WavFileSink(os.path.join(folder, "out.wav"))
+        cache = ClipCache(sink.rate, sink.channels, max_seconds=CLIP_SECONDS)
+        mixer = Mixer(sink, cache)
+        with contextlib.redirect_stdout(io.StringIO()):  # "Playing ..." on every voice
+            results = {n: bench(mixer, sink, music, effect, n) for n in VOICES}
+        mixer.close()
+
+    block_ms = sink.blocksize / sink.rate * 1e3
+    print(
+        f"{BLOCKS} blocks per run, block = {sink.blocksize} frames ({block_ms:.1f} ms)"
+    )
+    print(f"{'voices':>6} {'p50 ms':>8} {'p99 ms':>8} {'% of block':>10}")
+    for n, (p50, p99) in results.items():
+        print(
+            f"{n:>6} {p50 * 1e3:>8.3f} {p99 * 1e3:>8.3f} {p99 * 1e3 / block_ms:>10.1%}"
+        )
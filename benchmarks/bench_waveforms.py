@@ -0,0 +1,49 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+import soundfile
+
+from macrodeck.gui.style import ICON_SIZE
+from macrodeck.Waveforms import WaveformCache
+
+# measures how long a view's waveform thumbnails take to get, by where they come from
+#   render      decoded and drawn (first time a file is seen)
+#   disk        read back from the png cache (every later switch, and after a restart)
+# run from the repo root: python -m benchmarks.bench_waveforms
+
+NBUTTONS = 30
+SECONDS = 60.0
+RATE = 44100
+
+
+def write_media(folder):
+    paths = []
+    t = np.arange(int(SECONDS * RATE)) / RATE
+    for i in range(NBUTTONS):
+        path = os.path.join(folder, f"media{i}.flac")
+        envelope = np.abs(np.sin(2 * np.pi * t / (5 + i)))
+        data = 0.5 * envelope * np.sin(2 * np.pi * 220 * (i + 1) * t)
+        soundfile.write(path, data.astype(np.float32), RATE)
+        paths.append(path)
+    return paths
+
+
+def bench(cache, paths):
+    start = time.perf_counter()
+    for path in paths:
+        cache.get(path)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        paths = write_media(folder)
+        cache = WaveformCache(os.path.join(folder, "waveforms"), ICON_SIZE)
+        results = {"render": bench(cache, paths), "disk": bench(cache, paths)}
+
+    print(f"{NBUTTONS} buttons, {SECONDS:g} s files, {ICON_SIZE[0]}x{ICON_SIZE[1]}")
+    print(f"{'source':>8} {'view ms':>8} {'per button ms':>14}")
+    for name, seconds in results.items():
+        print(f"{name:>8} {seconds * 1e3:>8.1f} {seconds * 1e3 / NBUTTONS:>14.2f}")
@@ -1,33 +1,36 @@
-from macrodeck import ActionClasses as act
-
-HAS_OBSWS = act.HAS_OBSWS
-
-ACTIONS = [
-    act.NoAction(),  # this should always be index 0
-    act.PlayMedia(),
-    act.ShuffleMedia(),  # dependent on PlayMedia
-    act.StopMedia(),
-    act.PauseMedia(),
-    act.MediaVolume(),
-    act.OpenView(),
-    act.Macro(),
-    act.Web(),
-    act.OBSScene(),
-    act.OBSMute(),
-    act.OBSToggleSceneSource(),
-    act.OBSCounterText(),
-    act.ManageWindow(),
-    act.EnterText(),
-]
-
-for i in range(len(ACTIONS)):
-    ACTIONS[i].set_enum(i)
-
-
-def add_action(actionclass):
-    """
-    adds action to ACTIONS and sets enum
-    I use this to add MultiAction within App.py & avoid circular import of ActionButton
-    """
-    actionclass.set_enum(len(ACTIONS))
-    ACTIONS.append(actionclass)
+from macrodeck import ActionClasses as act
+
+HAS_OBSWS = act.HAS_OBSWS
+
+ACTIONS = [
+    act.NoAction(),  # this should always be index 0
+    act.PlayMedia(),
+    act.ShuffleMedia(),  # dependent on PlayMedia
+    act.ShuffleLibrary(),
+    act.StopMedia(),
+    act.PauseMedia(),
+    act.MediaVolume(),
+    act.FadeMedia(),
+    act.OpenView(),
+    act.Macro(),
+    act.RecordedMacro(),
+    act.Web(),
+    act.OBSScene(),
+    act.OBSMute(),
+    act.OBSToggleSceneSource(),
+    act.OBSCounterText(),
+    act.ManageWindow(),
+    act.EnterText(),
+]
+
+for i in range(len(ACTIONS)):
+    ACTIONS[i].set_enum(i)
+
+
+def add_action(actionclass):
+    """
+    adds action to ACTIONS and sets enum
+    I use this to add MultiAction within App.py & avoid circular import of ActionButton
+    """
+    actionclass.set_enum(len(ACTIONS))
+    ACTIONS.append(actionclass)
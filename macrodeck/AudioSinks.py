@@ -0,0 +1,122 @@
+import threading
+import time
+import wave
+
+try:
+    import sounddevice
+
+    HAS_SOUNDDEVICE = True
+except (ModuleNotFoundError, OSError):  # OSError if PortAudio itself is missing
+    HAS_SOUNDDEVICE = False
+
+# sinks pull 16 bit interleaved PCM from a source and send it somewhere
+#
+# a source is any function source(frames) -> bytes that returns exactly frames * channels * 2 bytes
+# (silence included). start(source) begins pulling, stop() ends it.
+# sample rate and channel count are fixed per sink, sources convert to them
+
+SAMPLE_WIDTH = 2  # bytes, int16
+
+
+class SoundDeviceSink:
+    """
+    plays to the default output device through PortAudio
+
+    the stream stays open between sounds and asks for small blocks, so a new sound
+    reaches the device within a block or two instead of after opening a stream
+    """
+
+    def __init__(self, rate=48000, channels=2, blocksize=256):
+        self.rate = rate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.stream = None
+
+    def start(self, source):
+        def callback(outdata, frames, time, status):
+            outdata[:] = source(frames)
+
+        self.stream = sounddevice.RawOutputStream(
+            samplerate=self.rate,
+            channels=self.channels,
+            dtype="int16",
+            blocksize=self.blocksize,
+            latency="low",
+            callback=callback,
+        )
+        self.stream.start()
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def latency(self):
+        # seconds between a block leaving the callback and coming out of the speakers
+        return 0.0 if self.stream is None else self.stream.latency
+
+
+class WavFileSink:
+    """
+    writes everything it pulls to a wav file, for tests and running headless
+
+    with realtime=True a thread pulls one block per block duration, like a sound card would.
+    otherwise nothing is pulled until render() is called, so output is deterministic
+    """
+
+    def __init__(self, filename, rate=48000, channels=2, blocksize=256, realtime=False):
+        self.filename = filename
+        self.rate = rate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.realtime = realtime
+        self.source = None
+        self.file = None
+        self.thread = None
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+
+    def start(self, source):
+        self.source = source
+        self.file = wave.open(self.filename, "wb")
+        self.file.setnchannels(self.channels)
+        self.file.setsampwidth(SAMPLE_WIDTH)
+        self.file.setframerate(self.rate)
+
+        if self.realtime:
+            self.stopped.clear()
+            self.thread = threading.Thread(
+                target=self.run, daemon=True, name="Wav File Sink"
+            )
+            self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def render(self, frames):
+        # pulls frames from the source and writes them, one block at a time
+        with self.lock:
+            while frames > 0:
+                n = min(frames, self.blocksize)
+                self.file.writeframesraw(self.source(n))
+                frames -= n
+
+    def run(self):
+        period = self.blocksize / self.rate
+        deadline = time.perf_counter()
+        while not self.stopped.is_set():
+            self.render(self.blocksize)
+            deadline += period
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                self.stopped.wait(delay)
+
+    def latency(self):
+        return 0.0
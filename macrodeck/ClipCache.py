@@ -0,0 +1,218 @@
+import os
+import threading
+import time
+import wave
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    import soundfile
+
+    HAS_SOUNDFILE = True
+except (ModuleNotFoundError, OSError):  # OSError if libsndfile itself is missing
+    HAS_SOUNDFILE = False
+
+# short sound effects decoded to PCM once and kept in memory, so a key press doesn't wait
+# for libvlc to open and demux the file. without soundfile, only wavs already in the sink's format are cached
+
+# soundfile raises RuntimeErrors
+DECODE_ERRORS = (RuntimeError, OSError, EOFError, wave.Error)
+
+
+class Clip:
+    def __init__(self, path, mtime, pcm, frames):
+        self.path = path
+        self.mtime = mtime
+        self.pcm = pcm  # int16 interleaved, in the cache's rate/channels
+        self.frames = frames
+
+
+class ClipCache:
+    """
+    LRU cache of decoded clips, bounded by the total size of their PCM
+
+    files longer than max_seconds aren't cached; get() returns None for them (and for files
+    it can't decode) so the caller can play them the normal way
+    """
+
+    def __init__(self, rate=48000, channels=2, max_bytes=64 * 2**20, max_seconds=5.0):
+        self.rate = rate
+        self.channels = channels
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.clips = OrderedDict()  # path -> Clip, least recently used first
+        self.nbytes = 0
+        self.skipped = {}  # path -> mtime of files that can't be cached
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        with self.lock:
+            clip = self.clips.get(path)
+            if clip is not None and clip.mtime == mtime:
+                self.clips.move_to_end(path)
+                return clip
+            if self.skipped.get(path) == mtime:
+                return None
+
+        # decode without the lock so other clips can still play meanwhile
+        pcm = None
+        try:
+            seconds = duration(path)
+            if seconds is not None and seconds <= self.max_seconds:
+                pcm = decode(path, self.rate, self.channels)
+        except DECODE_ERRORS:
+            pass
+
+        with self.lock:
+            if pcm is None or len(pcm) > self.max_bytes:
+                self.skipped[path] = mtime
+                return None
+
+            old = self.clips.pop(path, None)
+            if old is not None:
+                self.nbytes -= len(old.pcm)
+            clip = Clip(path, mtime, pcm, len(pcm) // (2 * self.channels))
+            self.clips[path] = clip
+            self.nbytes += len(pcm)
+            while self.nbytes > self.max_bytes:
+                _, evicted = self.clips.popitem(last=False)
+                self.nbytes -= len(evicted.pcm)
+            return clip
+
+
+class ClipPlayer:
+    """
+    plays cached clips through a sink (see AudioSinks) that stays open between sounds
+
+    one clip at a time: playing a clip replaces whatever clip was playing
+    volume is 0-100 like the mixer's, and each clip also has its own (loudness) gain
+    triggered/first_sample are perf_counter times of the last play() and of the sink pulling its first block
+    """
+
+    def __init__(self, sink, cache, volume=50):
+        self.sink = sink
+        self.cache = cache
+        self.frame_size = 2 * sink.channels
+        self.volume = volume
+        self.clip = None
+        self.gain = 1.0  # of self.clip
+        self.pos = 0  # byte offset into self.clip.pcm
+        self.triggered = None
+        self.first_sample = None
+        self.lock = threading.Lock()
+        sink.start(self.read)
+
+    def play(self, path, gain=1.0):
+        # returns False if path isn't a clip we can cache
+        triggered = time.perf_counter()
+        clip = self.cache.get(path)
+        if clip is None:
+            return False
+
+        with self.lock:
+            self.clip = clip
+            self.gain = gain
+            self.pos = 0
+            self.triggered = triggered
+            self.first_sample = None
+        print(f"Playing {os.path.basename(path)}".encode("utf8"))
+        return True
+
+    def stop(self):
+        with self.lock:
+            self.clip = None
+
+    def set_volume(self, value):
+        self.volume = value
+
+    def playing(self):
+        return self.clip is not None
+
+    def close(self):
+        self.stop()
+        self.sink.stop()
+
+    def read(self, frames):
+        # source for the sink
+        n = frames * self.frame_size
+        with self.lock:
+            clip = self.clip
+            if clip is None:
+                return bytes(n)
+            if self.pos == 0:
+                self.first_sample = time.perf_counter()
+            chunk = clip.pcm[self.pos : self.pos + n]
+            factor = self.volume / 100 * self.gain
+            self.pos += n
+            if self.pos >= len(clip.pcm):
+                self.clip = None
+
+        if factor != 1.0:
+            chunk = scale(chunk, factor)
+        if len(chunk) < n:
+            chunk += bytes(n - len(chunk))
+        return chunk
+
+
+# helper functions
+
+
+def duration(path):
+    # returns length of path in seconds, or None if we can't read it
+    if HAS_SOUNDFILE:
+        return soundfile.info(path).duration
+    if path.lower().endswith(".wav"):
+        with wave.open(path, "rb") as f:
+            return f.getnframes() / f.getframerate()
+    return None
+
+
+def decode(path, rate, channels):
+    # returns path as int16 interleaved PCM at rate/channels, or None if we can't
+    if not HAS_SOUNDFILE:
+        return decode_wav(path, rate, channels)
+
+    data, file_rate = soundfile.read(path, dtype="float32", always_2d=True)
+    if data.shape[1] != channels:
+        data = np.repeat(data.mean(axis=1, keepdims=True), channels, axis=1)
+    if file_rate != rate:
+        data = resample(data, file_rate, rate)
+    return (np.clip(data, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+def decode_wav(path, rate, channels):
+    # no resampling without numpy, so the wav has to match already
+    if not path.lower().endswith(".wav"):
+        return None
+    with wave.open(path, "rb") as f:
+        fmt = (f.getsampwidth(), f.getframerate(), f.getnchannels())
+        if fmt != (2, rate, channels):
+            return None
+        return f.readframes(f.getnframes())
+
+
+def scale(pcm, factor):
+    # returns int16 pcm multiplied by factor, clipped
+    if HAS_SOUNDFILE:
+        samples = np.frombuffer(pcm, dtype="<i2") * np.float32(factor)
+        return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+    samples = array("h", pcm)
+    for i, sample in enumerate(samples):
+        samples[i] = max(-32768, min(32767, int(sample * factor)))
+    return samples.tobytes()
+
+
+def resample(data, src_rate, rate):
+    # linear interpolation; fine for short effects
+    n = round(len(data) * rate / src_rate)
+    x = np.arange(n) * (src_rate / rate)
+    xp = np.arange(len(data))
+    return np.stack(
+        [np.interp(x, xp, data[:, c]) for c in range(data.shape[1])], axis=1
+    )
@@ -0,0 +1,106 @@
+import threading
+import time
+
+TICK = 0.02  # seconds between volume updates, shared by every fade
+
+
+class Fader:
+    """
+    runs volume ramps on one thread
+
+    every tick, each ramp moves its volume to where it should be by now, so fifty fades
+    cost one wakeup instead of fifty threads. a ramp only needs a setter, so anything
+    with a volume can be faded (players, mixer voices)
+
+    ramps are keyed: starting a ramp on a key that's already fading replaces the old one
+    (without calling its on_done). the thread sleeps while nothing is fading
+    """
+
+    def __init__(self, tick=TICK):
+        self.tick = tick
+        self.ramps = {}  # key -> Ramp
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True, name="Fader")
+        self.thread.start()
+
+    def ramp(self, key, setter, start, end, seconds, on_done=None):
+        # fades from start to end (0-100) over seconds, calling setter(volume) with ints,
+        # then on_done() once it gets there
+        with self.cond:
+            self.ramps[key] = Ramp(
+                setter, start, end, time.perf_counter(), seconds, on_done
+            )
+            self.cond.notify()
+
+    def cancel(self, key):
+        # stops fading key where it is, without calling on_done
+        with self.cond:
+            self.ramps.pop(key, None)
+
+    def fading(self, key):
+        return key in self.ramps
+
+    def active(self):
+        # returns number of ramps running
+        return len(self.ramps)
+
+    def run(self):
+        deadline = time.perf_counter()
+        while True:
+            with self.cond:
+                while not self.ramps:
+                    self.cond.wait()
+                    deadline = time.perf_counter()
+
+                now = time.perf_counter()
+                updates = []
+                finished = []
+                for key, ramp in list(self.ramps.items()):
+                    volume = ramp.update(now)
+                    if volume is not None:
+                        updates.append((ramp.setter, volume))
+                    if ramp.done:
+                        del self.ramps[key]
+                        if ramp.on_done is not None:
+                            finished.append(ramp.on_done)
+
+            # outside the lock, since setters and on_done can start new ramps
+            for setter, volume in updates:
+                setter(volume)
+            for on_done in finished:
+                on_done()
+
+            deadline += self.tick
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.perf_counter()  # fell behind; don't try to catch up
+
+
+class Ramp:
+    def __init__(self, setter, start, end, started, seconds, on_done):
+        self.setter = setter
+        self.start = start
+        self.end = end
+        self.started = started
+        self.seconds = seconds
+        self.on_done = on_done
+        self.value = start
+        self.sent = None  # last volume passed to setter
+        self.done = False
+
+    def update(self, now):
+        # returns the volume to set, or None if it hasn't changed since the last tick
+        if self.seconds <= 0 or now - self.started >= self.seconds:
+            self.value = self.end
+            self.done = True
+        else:
+            progress = (now - self.started) / self.seconds
+            self.value = self.start + (self.end - self.start) * progress
+
+        volume = round(self.value)
+        if volume == self.sent:
+            return None
+        self.sent = volume
+        return volume
@@ -1,131 +1,572 @@
-import time
-
-from pynput._util import win32_vks  # gets keycodes
-from pynput.keyboard import (  # threading/thread wrapper for hotkeys
-    Controller,
-    HotKey,
-    KeyCode,
-    Listener,
-)
-
-
-# Create custom pynput class to avoid a bug with virtual key codes: ########
-class MyHotKey(HotKey):
-    def press(self, key):
-        # remove scan code from input key because it's not input correctly in the hotkey
-        if hasattr(key, "_scan"):
-            setattr(key, "_scan", None)
-        if key in self._keys and key not in self._state:
-            self._state.add(key)
-            if self._state == self._keys:
-                self._on_activate()
-
-    def release(self, key):
-        """Updates the hotkey state for a released key.
-
-        :param key: The key being released.
-        :type key: Key or KeyCode
-        """
-        # remove scan code from input key because it's not input correctly in the hotkey
-        if hasattr(key, "_scan"):
-            setattr(key, "_scan", None)
-        if key in self._state:
-            self._state.remove(key)
-
-        # TODO try just clearing self._state here to avoid sticky hotkeys
-
-
-class MyGlobalHotKeys(Listener):
-    """A keyboard listener supporting a number of global hotkeys.
-
-    This is a convenience wrapper to simplify registering a number of global
-    hotkeys.
-
-    :param dict hotkeys: A mapping from hotkey description to hotkey action.
-        Keys are strings passed to :meth:`HotKey.parse`.
-
-    :raises ValueError: if any hotkey description is invalid
-    """
-
-    def __init__(self, hotkeys, *args, **kwargs):
-        self._hotkeys = [
-            MyHotKey(HotKey.parse(key), value) for key, value in hotkeys.items()
-        ]
-        super(MyGlobalHotKeys, self).__init__(
-            on_press=self._on_press, on_release=self._on_release, *args, **kwargs
-        )
-
-    def _on_press(self, key):
-        """The press callback.
-
-        This is automatically registered upon creation.
-
-        :param key: The key provided by the base class.
-        """
-        for hotkey in self._hotkeys:
-            hotkey.press(self.canonical(key))
-
-    def _on_release(self, key):
-        """The release callback.
-
-        This is automatically registered upon creation.
-
-        :param key: The key provided by the base class.
-        """
-        for hotkey in self._hotkeys:
-            hotkey.release(self.canonical(key))
-
-
-##############################
-# Macro Keyboard Class: ###########
-##############################
-
-
-class keyboard(Controller):
-    def press_keys(self, keys, seconds=0.0):
-        for key in keys:
-            self.press(key)
-        if seconds:
-            time.sleep(seconds)
-        for key in keys:
-            self.release(key)
-
-        time.sleep(
-            0.1
-        )  # need some delay between each key press to prevent bugs. Not sure what the minimum is
-        return
-
-
-##############################
-# HotKey Functions: ###########
-##############################
-
-
-def init_hotkeys(buttons):
-    hkmap = hotkeymap(buttons)
-    return MyGlobalHotKeys(hkmap)
-
-
-def hotkeymap(buttons):
-    hotkeys = [(button.modifier, button.key, button.run_action) for button in buttons]
-    return {
-        f"{hotkey[0]}<{keycode(hotkey[1][1:-1])}>"
-        if hotkey[1][0] == "<" and hotkey[1][-1] == ">"
-        else f"{hotkey[0]}{hotkey[1]}": hotkey[2]
-        for hotkey in hotkeys
-    }
-
-
-#######################################################
-# Helper Functions (for threads and hotkeys): ##########
-#######################################################
-
-
-def keycode(key):
-    if key[0] == "<" and key[-1] == ">":
-        key = key[1:-1]
-    return eval(f"win32_vks.{key.upper()}")
-
-
-def to_pynput(key):
-    return key if len(key) == 1 else KeyCode.from_vk(keycode(key))
+import ctypes
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from functools import lru_cache, partial
+
+from pynput._util import win32_vks  # gets keycodes
+from pynput.keyboard import (  # threading/thread wrapper for hotkeys
+    Controller,
+    HotKey,
+    Key,
+    KeyCode,
+    Listener,
+)
+
+try:
+    import win32clipboard
+
+    HAS_CLIPBOARD = True
+except ModuleNotFoundError:
+    HAS_CLIPBOARD = False
+
+try:
+    from pynput._util.win32 import INPUT, INPUT_union, KEYBDINPUT, SendInput
+
+    HAS_SENDINPUT = True
+except ImportError:
+    HAS_SENDINPUT = False
+
+# how long an injected key is expected to take to come back through the keyboard hook.
+# after this it's assumed the event was swallowed, so a real press of that key isn't ignored
+INJECTION_TIMEOUT = 0.5
+# longest a macro waits for the keys that triggered it to be released, or for the keys it sent to
+# come back through the hook, before going ahead anyway
+MACRO_WAIT = 0.25
+# hotkey presses waiting to run. more than this means actions are stuck, so new presses are dropped
+DISPATCH_QUEUE_SIZE = 32
+# text at least this long is pasted through the clipboard instead of typed. a paste always takes
+# PASTE_SETTLE, which is about what typing this much takes when the target app keeps up
+PASTE_MIN_CHARS = 1000
+# characters typed per SendInput call
+TYPE_CHUNK = 64
+# how long the target app gets to read a pasted clipboard before it's restored.
+# there's no way to know when it has, so this is a guess
+PASTE_SETTLE = 0.1
+# typed as keys, not characters: apps ignore unicode newlines
+CONTROL_KEYS = {"\n": Key.enter, "\r": Key.enter, "\t": Key.tab}
+
+
+class Injections:
+    """
+    keys this process is about to send with a keyboard Controller
+
+    the hotkey listener sees injected keys like any others. keyboard.press/release log each key
+    here before sending it, and MyGlobalHotKeys drops the event that matches, so macros can't
+    trigger (or get stuck in) hotkeys and the listener never has to be restarted around them
+    """
+
+    def __init__(self, timeout=INJECTION_TIMEOUT):
+        self.timeout = timeout
+        self.pending = deque()  # (deadline, key, is_press)
+        self.lock = threading.Condition()
+
+    def add(self, key, is_press):
+        if isinstance(key, str):
+            key = KeyCode.from_char(key)
+        with self.lock:
+            self.pending.append((time.monotonic() + self.timeout, key, is_press))
+
+    def consume(self, key, is_press, canonical):
+        """
+        checks if key is one we sent, removing it from pending if so
+
+        canonical is the listener's canonical_key, to compare keys sent by char with the
+        events they come back as
+        """
+        if not self.pending:
+            return False
+
+        with self.lock:
+            now = time.monotonic()
+            while self.pending and self.pending[0][0] < now:
+                self.pending.popleft()
+            for i, (_, sent, pressed) in enumerate(self.pending):
+                if pressed == is_press and same_key(sent, key, canonical):
+                    del self.pending[i]
+                    if not self.pending:
+                        self.lock.notify_all()
+                    return True
+        return False
+
+    def wait_delivered(self, timeout=MACRO_WAIT):
+        # waits until every key sent has come back through the hook
+        def delivered():
+            now = time.monotonic()
+            while self.pending and self.pending[0][0] < now:
+                self.pending.popleft()
+            return not self.pending
+
+        with self.lock:
+            return self.lock.wait_for(delivered, timeout)
+
+
+injections = Injections()
+
+
+class HotkeyDispatcher:
+    """
+    runs hotkey actions in press order on its own thread
+
+    the keyboard hook only calls submit, which never blocks: actions can talk to OBS or wait on
+    Tk without stalling the hook (windows silently removes low level hooks that take too long)
+    """
+
+    def __init__(self, size=DISPATCH_QUEUE_SIZE):
+        self.actions = queue.Queue(maxsize=size)
+        self.dropped = 0
+        self.thread = threading.Thread(
+            target=self.run, daemon=True, name="Hotkey Dispatch"
+        )
+        self.thread.start()
+
+    def submit(self, action):
+        try:
+            self.actions.put_nowait(action)
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self):
+        # lets queued actions finish first
+        self.actions.put(None)
+
+    def run(self):
+        while True:
+            action = self.actions.get()
+            if action is None:
+                return
+            try:
+                action()
+            except Exception:  # one broken action shouldn't stop every hotkey
+                traceback.print_exc()
+
+
+# Create custom pynput class to avoid a bug with virtual key codes: ########
+# keys passed to press/release must already be canonical and have their scan code removed
+# (MyGlobalHotKeys does this once per event, see MyGlobalHotKeys.canonical_key)
+class MyHotKey(HotKey):
+    def press(self, key):
+        if key in self._keys and key not in self._state:
+            self._state.add(key)
+            if self._state == self._keys:
+                self._on_activate()
+
+    def release(self, key):
+        """Updates the hotkey state for a released key.
+
+        :param key: The key being released.
+        :type key: Key or KeyCode
+        """
+        if key in self._state:
+            self._state.remove(key)
+
+        # TODO try just clearing self._state here to avoid sticky hotkeys
+
+
+class MyGlobalHotKeys(Listener):
+    """A keyboard listener supporting a number of global hotkeys.
+
+    This is a convenience wrapper to simplify registering a number of global
+    hotkeys.
+
+    :param dict hotkeys: A mapping from hotkey description to hotkey action.
+        Keys are strings passed to :meth:`HotKey.parse`.
+
+    :param Injections injections: Keys sent by this process, which are ignored.
+
+    Actions run on a :class:`HotkeyDispatcher`, not the listener thread.
+    ``hook_time()`` reports how long the listener spends on each event.
+
+    :raises ValueError: if any hotkey description is invalid
+    """
+
+    def __init__(self, hotkeys, *args, injections=injections, **kwargs):
+        self._injections = injections
+        self._dispatcher = HotkeyDispatcher()
+        self._bindings = None
+        self.set_hotkeys(hotkeys)
+        # keys physically held down right now (canonical)
+        self._held = set()
+        self._held_cond = threading.Condition()
+        # called with (key, is_press) for every key physically pressed, see MacroRecorder
+        self._recorder = None
+        # time spent in _on_press/_on_release, in ns
+        self._hook_events = 0
+        self._hook_total = 0
+        self._hook_max = 0
+        super(MyGlobalHotKeys, self).__init__(
+            on_press=self._on_press, on_release=self._on_release, *args, **kwargs
+        )
+
+    def stop(self):
+        super(MyGlobalHotKeys, self).stop()
+        self._dispatcher.stop()
+
+    def hook_time(self):
+        """Returns (mean, max) time the listener took per key event, in µs."""
+        if not self._hook_events:
+            return 0.0, 0.0
+        return self._hook_total / self._hook_events / 1e3, self._hook_max / 1e3
+
+    def _timed(self, start):
+        elapsed = time.perf_counter_ns() - start
+        self._hook_events += 1
+        self._hook_total += elapsed
+        if elapsed > self._hook_max:
+            self._hook_max = elapsed
+
+    def set_recorder(self, recorder):
+        """Sets (or with None, clears) the function keys are recorded with."""
+        self._recorder = recorder
+
+    def wait_released(self, keys=(), timeout=MACRO_WAIT):
+        """Waits until no modifier, and none of keys, is physically held down.
+
+        Keys still held after timeout are assumed to have had their release
+        missed, and are forgotten.
+        """
+        blocking = MODIFIER_KEYS + tuple(keys)
+
+        def blockers():
+            return [
+                held
+                for held in self._held
+                if any(same_key(key, held, self.canonical_key) for key in blocking)
+            ]
+
+        with self._held_cond:
+            if self._held_cond.wait_for(lambda: not blockers(), timeout):
+                return True
+            self._held.difference_update(blockers())
+            return False
+
+    def set_hotkeys(self, hotkeys):
+        """Replaces the hotkeys without restarting the listener.
+
+        Nothing is rebuilt if the bindings haven't changed.
+
+        :raises ValueError: if any hotkey description is invalid
+        """
+        if hotkeys == self._bindings:
+            return
+
+        submit = self._dispatcher.submit
+        hotkey_list = [
+            MyHotKey(parse_hotkey(key), partial(submit, value))
+            for key, value in hotkeys.items()
+        ]
+        # key -> hotkeys that use it, so an event only touches the hotkeys it can affect.
+        # this runs inside the OS keyboard hook for every key typed anywhere
+        index = {}
+        for hotkey in hotkey_list:
+            for key in hotkey._keys:
+                index.setdefault(key, []).append(hotkey)
+
+        # the hook thread only reads these, so swapping them is enough
+        self._hotkeys, self._index = hotkey_list, index
+        self._bindings = dict(hotkeys)
+
+    def canonical_key(self, key):
+        """Returns the canonical form of key, as used by the hotkeys."""
+        key = self.canonical(key)
+        # remove scan code from input key because it's not input correctly in the hotkey
+        if hasattr(key, "_scan"):
+            setattr(key, "_scan", None)
+        return key
+
+    def _on_press(self, key):
+        """The press callback.
+
+        This is automatically registered upon creation.
+
+        :param key: The key provided by the base class.
+        """
+        start = time.perf_counter_ns()
+        if not self._injections.consume(key, True, self.canonical_key):
+            recorder = self._recorder
+            if recorder is not None:
+                recorder(key, True)
+            key = self.canonical_key(key)
+            with self._held_cond:
+                self._held.add(key)
+            for hotkey in self._index.get(key, ()):
+                hotkey.press(key)
+        self._timed(start)
+
+    def _on_release(self, key):
+        """The release callback.
+
+        This is automatically registered upon creation.
+
+        :param key: The key provided by the base class.
+        """
+        start = time.perf_counter_ns()
+        if not self._injections.consume(key, False, self.canonical_key):
+            recorder = self._recorder
+            if recorder is not None:
+                recorder(key, False)
+            key = self.canonical_key(key)
+            with self._held_cond:
+                self._held.discard(key)
+                self._held_cond.notify_all()
+            for hotkey in self._index.get(key, ()):
+                hotkey.release(key)
+        self._timed(start)
+
+
+##############################
+# Macro Keyboard Class: ###########
+##############################
+
+
+class keyboard(Controller):
+    # every key sent is logged first, so the hotkey listener knows it came from us
+    def press(self, key):
+        injections.add(key, True)
+        super().press(key)
+
+    def release(self, key):
+        injections.add(key, False)
+        super().release(key)
+
+    def press_keys(self, keys, seconds=0.0):
+        for key in keys:
+            self.press(key)
+        if seconds:
+            time.sleep(seconds)
+        for key in keys:
+            self.release(key)
+
+    def send_macro(self, keys, hotkeys=None):
+        """
+        presses keys (from compile_macro) once the hotkey that triggered the macro is released
+
+        hotkeys is the running MyGlobalHotKeys, used to see which keys are held and when the
+        keys sent come back through the hook. without it, keys are sent straight away
+        """
+
+        # held modifiers would be added to the macro
+        if hotkeys is not None:
+            hotkeys.wait_released(keys)
+        self.press_keys(keys)
+        # the next macro can't start before these reach the hook
+        if hotkeys is not None:
+            injections.wait_delivered()
+
+    def enter_text(self, text, clipboard=None, hotkeys=None):
+        """
+        types text, or pastes it with clipboard (a Clipboard) if it's long.
+        returns "paste" or "type"
+
+        with hotkeys, waits for held modifiers to be released first, like send_macro
+        """
+
+        if hotkeys is not None:
+            hotkeys.wait_released()
+        if clipboard is not None and len(text) >= PASTE_MIN_CHARS:
+            self.paste_text(text, clipboard, hotkeys)
+            return "paste"
+        self.type_text(text, hotkeys)
+        return "type"
+
+    def type_text(self, text, hotkeys=None, chunk=TYPE_CHUNK):
+        # with hotkeys, each chunk waits for the last to reach the hook, so the input queue
+        # never backs up
+        text = text.replace("\r\n", "\n")
+        for i in range(0, len(text), chunk):
+            self.type_chunk(text[i : i + chunk])
+            if hotkeys is not None:
+                injections.wait_delivered()
+
+    def type_chunk(self, text):
+        # control characters are pressed as keys, each run of text between them is sent at once
+        start = 0
+        for i, char in enumerate(text):
+            if char in CONTROL_KEYS:
+                self.send_text(text[start:i])
+                self.tap(CONTROL_KEYS[char])
+                start = i + 1
+        self.send_text(text[start:])
+
+    def send_text(self, text):
+        # one SendInput call for the whole string, as unicode characters
+        if not text:
+            return
+        if not HAS_SENDINPUT:
+            self.type(text)
+            return
+
+        for char in text:
+            # characters outside the BMP come back as two surrogates, which wouldn't match
+            if ord(char) <= 0xFFFF:
+                injections.add(char, True)
+                injections.add(char, False)
+
+        units = text.encode("utf-16-le")
+        inputs = []
+        for i in range(0, len(units), 2):
+            unit = int.from_bytes(units[i : i + 2], "little")
+            for flags in (KEYBDINPUT.UNICODE, KEYBDINPUT.UNICODE | KEYBDINPUT.KEYUP):
+                inputs.append(
+                    INPUT(
+                        type=INPUT.KEYBOARD,
+                        value=INPUT_union(ki=KEYBDINPUT(dwFlags=flags, wScan=unit)),
+                    )
+                )
+        SendInput(len(inputs), (INPUT * len(inputs))(*inputs), ctypes.sizeof(INPUT))
+
+    def tap(self, key):
+        self.press(key)
+        self.release(key)
+
+    def paste_text(self, text, clipboard, hotkeys=None):
+        # puts text on the clipboard, sends ctrl+v, then puts back what was there
+        saved = clipboard.get()
+        clipboard.set(text)
+        try:
+            self.send_macro(PASTE_KEYS, hotkeys)
+            time.sleep(PASTE_SETTLE)
+        finally:
+            clipboard.set(saved)
+
+
+class Clipboard:
+    """
+    text on the windows clipboard. get returns None if there isn't any
+
+    only text is saved and restored around a paste: anything else on the clipboard is lost
+    """
+
+    def get(self):
+        win32clipboard.OpenClipboard()
+        try:
+            if not win32clipboard.IsClipboardFormatAvailable(
+                win32clipboard.CF_UNICODETEXT
+            ):
+                return None
+            return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def set(self, text):
+        # None just empties it
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            if text is not None:
+                win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+        finally:
+            win32clipboard.CloseClipboard()
+
+
+##############################
+# HotKey Functions: ###########
+##############################
+
+
+def init_hotkeys(buttons):
+    hkmap = hotkeymap(buttons)
+    return MyGlobalHotKeys(hkmap)
+
+
+def hotkeymap(buttons):
+    hotkeys = [(button.modifier, button.key, button.run_action) for button in buttons]
+    return {
+        f"{hotkey[0]}<{keycode(hotkey[1][1:-1])}>"
+        if hotkey[1][0] == "<" and hotkey[1][-1] == ">"
+        else f"{hotkey[0]}{hotkey[1]}": hotkey[2]
+        for hotkey in hotkeys
+    }
+
+
+#######################################################
+# Helper Functions (for threads and hotkeys): ##########
+#######################################################
+
+
+@lru_cache(maxsize=None)
+def parse_hotkey(description):
+    # parsed once per description; rebinding one button doesn't reparse the rest
+    return tuple(HotKey.parse(description))
+
+
+def same_key(sent, key, canonical):
+    # compares by virtual key code when both have one, e.g. a macro's KeyCode.from_vk against
+    # the event, which also carries a char; otherwise by canonical form.
+    # modifiers are sent by their generic code but come back as left/right, see GENERIC_VKS
+    sent_vk = vk(sent)
+    key_vk = vk(key)
+    if sent_vk is not None and key_vk is not None:
+        return sent_vk == key_vk
+    return canonical(sent) == canonical(key)
+
+
+MODIFIER_KEYS = tuple(
+    getattr(Key, name)
+    for name in (
+        "alt",
+        "alt_l",
+        "alt_r",
+        "alt_gr",
+        "ctrl",
+        "ctrl_l",
+        "ctrl_r",
+        "shift",
+        "shift_l",
+        "shift_r",
+        "cmd",
+        "cmd_l",
+        "cmd_r",
+    )
+)
+
+
+# ctrl+v by key code, so the layout (or caps lock) can't turn it into ctrl+shift+v
+PASTE_KEYS = (KeyCode.from_vk(win32_vks.CONTROL), KeyCode.from_vk(ord("V")))
+
+
+# the windows hook reports which modifier it was, SendInput (and KeyCategories) use the generic one
+GENERIC_VKS = {
+    win32_vks.LSHIFT: win32_vks.SHIFT,
+    win32_vks.RSHIFT: win32_vks.SHIFT,
+    win32_vks.LCONTROL: win32_vks.CONTROL,
+    win32_vks.RCONTROL: win32_vks.CONTROL,
+    win32_vks.LMENU: win32_vks.MENU,
+    win32_vks.RMENU: win32_vks.MENU,
+}
+
+
+def vk(key):
+    if isinstance(key, Key):
+        key = key.value
+    code = getattr(key, "vk", None)
+    return GENERIC_VKS.get(code, code)
+
+
+@lru_cache(maxsize=None)
+def compile_macro(modifier, key):
+    """
+    returns the pynput keys a macro presses, in order
+
+    modifier is "+"-joined vk names (or ""), key is a single key name (or "").
+    compiled once per keyset, when the macro is configured
+    """
+    names = modifier.split("+") if modifier else []
+    if key:
+        names.append(key)
+    return tuple(to_pynput(name) for name in names)
+
+
+def keycode(key):
+    if key[0] == "<" and key[-1] == ">":
+        key = key[1:-1]
+    try:
+        return getattr(win32_vks, key.upper())
+    except AttributeError:
+        raise ValueError(f"unknown key: {key}") from None
+
+
+def to_pynput(key):
+    return key if len(key) == 1 else KeyCode.from_vk(keycode(key))
@@ -0,0 +1,411 @@
+"""
+smart playlists: small query language over the song metadata in a TagStore
+
+    duration < 10s AND folder under sfx/
+    artist = "Some Band" OR (title ~ intro AND NOT album_gain > -3)
+
+fields:
+    duration, track_gain, album_gain    numbers. compare with < <= > >= = !=
+                                        durations take an optional unit: 500ms, 10s, 2m
+    title, artist                       text, case insensitive. = != or ~ (contains)
+    folder                              path relative to the library
+                                        "folder = x" is just x, "folder under x" is x and all its subdirs
+AND binds tighter than OR; use parentheses to group. quote values with spaces in them.
+
+results are sorted sequences of song indices (a range or an array), which
+Library.shuffle and Library.rsong accept through their tracks argument
+"""
+
+import operator
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from macrodeck.MediaTags import TAG_FIELDS
+
+NUMERIC_FIELDS = ("duration", "track_gain", "album_gain")
+TEXT_FIELDS = ("title", "artist")
+FIELDS = NUMERIC_FIELDS + TEXT_FIELDS + ("folder",)
+
+OPERATORS = {
+    "numeric": ("<", "<=", ">", ">=", "=", "!="),
+    "text": ("=", "!=", "~"),
+    "folder": ("=", "under"),
+}
+UNITS = {"ms": 0.001, "s": 1, "m": 60}
+COMPARISONS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+    "!=": operator.ne,
+}
+NAN = float("nan")
+
+TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<paren>[()])
+        |(?P<op><=|>=|!=|<|>|=|~)
+        |"(?P<dquote>(?:[^"\\]|\\.)*)"
+        |'(?P<squote>(?:[^'\\]|\\.)*)'
+        |(?P<word>[^\s()<>=!~"']+)
+    )""",
+    re.VERBOSE,
+)
+NUMBER_RE = re.compile(r"([-+]?(?:\d+\.?\d*|\.\d+))(ms|s|m)?", re.IGNORECASE)
+
+
+class QueryIndex:
+    """
+    sorted arrays over the tags of every song in a library, so a query is a few binary searches
+
+    numeric fields keep their values sorted with the matching song indices alongside;
+    text fields map each (casefolded) value to the songs that have it.
+    folders don't need an index: Library.subtree already has the song range of every dir.
+    every field also has a column of per-song values, so an AND only looks up its most
+    selective term and checks the rest song by song
+
+    songs added or removed and tags read after it's built aren't seen; stale() says when to build
+    a new one.
+    songs the TagScanner hasn't reached yet only match folder predicates
+    """
+
+    def __init__(self, library, store):
+        self.library = library
+        self.store = store
+        self.tags_version = (
+            store.version
+        )  # read before the rows, so a write in between makes it stale
+        with library.lock:
+            self.version = library.version
+            self.nsongs = library.nsongs
+            paths = list(library.songs())
+        rows = store.rows()
+
+        # field -> value of each song. nan/None where the tag is missing
+        self.columns = {
+            field: array("d", [NAN]) * self.nsongs for field in NUMERIC_FIELDS
+        }
+        self.columns.update({field: [None] * self.nsongs for field in TEXT_FIELDS})
+        # field -> {value: song indices}
+        self.text = {field: {} for field in TEXT_FIELDS}
+        numeric = [
+            (TAG_FIELDS.index(field), self.columns[field]) for field in NUMERIC_FIELDS
+        ]
+        text = [
+            (TAG_FIELDS.index(field), self.columns[field], self.text[field])
+            for field in TEXT_FIELDS
+        ]
+
+        for ix, path in enumerate(paths):
+            row = rows.get(path)
+            if row is None:
+                continue
+            for col, column in numeric:
+                if row[col] is not None:
+                    column[ix] = row[col]
+            for col, column, values in text:
+                if row[col]:
+                    value = column[ix] = row[col].casefold()
+                    values.setdefault(value, array("I")).append(ix)
+
+        self.values = {}  # field -> sorted array of values
+        self.tracks = {}  # field -> song index of each value
+        for field in NUMERIC_FIELDS:
+            column = self.columns[field]
+            order = sorted(
+                (
+                    ix for ix in range(self.nsongs) if column[ix] == column[ix]
+                ),  # not nan
+                key=column.__getitem__,
+            )
+            self.values[field] = array("d", map(column.__getitem__, order))
+            self.tracks[field] = array("I", order)
+
+    def stale(self):
+        return (
+            self.library.version != self.version
+            or self.store.version != self.tags_version
+        )
+
+    def select(self, query):
+        # returns sorted sequence of song indices matching query
+        return self.evaluate(parse(query))
+
+    def evaluate(self, node):
+        kind = node[0]
+        if kind == "and":
+            return self.evaluate_and(node)
+        if kind == "or":
+            return union(self.evaluate(node[1]), self.evaluate(node[2]))
+        if kind == "not":
+            return complement(self.evaluate(node[1]), self.nsongs)
+
+        _, field, op, value = node
+        if field == "folder":
+            return self.folder(op, value)
+        if field in NUMERIC_FIELDS:
+            return self.compare(field, op, value)
+        return self.match(field, op, value)
+
+    def evaluate_and(self, node):
+        # starts from the term with the fewest matches, then either filters those songs
+        # through the other terms or intersects with them, whichever touches fewer songs
+        terms = sorted(flatten_and(node), key=self.estimate)
+        found = self.evaluate(terms[0])
+        for term in terms[1:]:
+            if term[0] == "cmp" and term[1] == "folder":
+                found = intersect(found, self.evaluate(term))  # just a slice
+            elif len(found) < self.estimate(term):
+                test = self.predicate(term)
+                found = array("I", [ix for ix in found if test(ix)])
+            else:
+                found = intersect(found, self.evaluate(term))
+        return found
+
+    def estimate(self, node):
+        # upper bound on the number of songs node matches, without building the set
+        kind = node[0]
+        if kind == "and":
+            return min(self.estimate(term) for term in flatten_and(node))
+        if kind == "or":
+            return min(self.estimate(node[1]) + self.estimate(node[2]), self.nsongs)
+        if kind == "not":
+            return self.nsongs
+
+        _, field, op, value = node
+        if field == "folder":
+            return len(self.folder(op, value))
+        if field in NUMERIC_FIELDS:
+            return sum(hi - lo for lo, hi in self.bounds(field, op, value))
+        if op == "=":
+            return len(self.text[field].get(value.casefold(), ()))
+        return self.nsongs
+
+    def predicate(self, node):
+        # returns function of song index -> whether it matches node
+        kind = node[0]
+        if kind in ("and", "or"):
+            left, right = self.predicate(node[1]), self.predicate(node[2])
+            if kind == "and":
+                return lambda ix: left(ix) and right(ix)
+            return lambda ix: left(ix) or right(ix)
+        if kind == "not":
+            inner = self.predicate(node[1])
+            return lambda ix: not inner(ix)
+
+        _, field, op, value = node
+        if field == "folder":
+            songs = self.folder(op, value)
+            return lambda ix: songs.start <= ix < songs.stop
+
+        column = self.columns[field]
+        if field in NUMERIC_FIELDS:
+            # nan compares False to everything, but untagged songs shouldn't match != either
+            compare = COMPARISONS[op]
+            return lambda ix: compare(column[ix], value) and column[ix] == column[ix]
+
+        value = value.casefold()
+        if op == "=":
+            return lambda ix: column[ix] == value
+        if op == "~":
+            return lambda ix: column[ix] is not None and value in column[ix]
+        return lambda ix: column[ix] is not None and column[ix] != value
+
+    def folder(self, op, value):
+        key = os.path.normpath(value.strip("/").replace("/", os.sep))
+        key = "" if key == "." else key
+        with self.library.lock:
+            try:
+                start, end = self.library.song_range(key, recursive=op == "under")
+            except KeyError:
+                return range(0)
+        # the library may have changed since the index was built
+        return range(min(start, self.nsongs), min(end, self.nsongs))
+
+    def bounds(self, field, op, value):
+        # returns [(lo, hi), ...] slices of self.tracks[field] that match
+        values = self.values[field]
+        lo = bisect_left(values, value)
+        hi = bisect_right(values, value)
+        return {
+            "<": [(0, lo)],
+            "<=": [(0, hi)],
+            ">": [(hi, len(values))],
+            ">=": [(lo, len(values))],
+            "=": [(lo, hi)],
+            "!=": [(0, lo), (hi, len(values))],
+        }[op]
+
+    def compare(self, field, op, value):
+        tracks = self.tracks[field]
+        found = []
+        for lo, hi in self.bounds(field, op, value):
+            found.extend(tracks[lo:hi])
+        return array("I", sorted(found))
+
+    def match(self, field, op, value):
+        values = self.text[field]
+        value = value.casefold()
+        if op == "=":
+            return values.get(value, array("I"))
+        if op == "~":
+            found = [ixs for text, ixs in values.items() if value in text]
+        else:  # !=
+            found = [ixs for text, ixs in values.items() if text != value]
+        if len(found) == 1:
+            return found[0]
+        return array("I", sorted(ix for ixs in found for ix in ixs))
+
+
+def flatten_and(node):
+    # returns the terms of a chain of ANDs
+    if node[0] != "and":
+        return [node]
+    return flatten_and(node[1]) + flatten_and(node[2])
+
+
+# parser
+# query := and ("OR" and)*
+# and   := not ("AND" not)*
+# not   := "NOT" not | "(" query ")" | field op value
+
+
+def parse(query):
+    # returns query as a tree of tuples: ("and", a, b), ("or", a, b), ("not", a) or ("cmp", field, op, value)
+    tokens = tokenize(query)
+    if not tokens:
+        raise ValueError("empty query")
+    node, i = parse_or(tokens, 0)
+    if i != len(tokens):
+        raise ValueError(f"unexpected {tokens[i][1]!r} in query")
+    return node
+
+
+def tokenize(query):
+    # returns list of (kind, text)
+    tokens = []
+    pos = 0
+    query = query.rstrip()
+    while pos < len(query):
+        m = TOKEN_RE.match(query, pos)
+        if m is None:
+            raise ValueError(f"can't parse query at {query[pos:]!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        text = m.group(kind)
+        if kind in ("dquote", "squote"):
+            tokens.append(("value", re.sub(r"\\(.)", r"\1", text)))
+        elif kind == "word" and text.upper() in ("AND", "OR", "NOT"):
+            tokens.append((text.upper(), text))
+        elif kind == "word" and text.lower() == "under":
+            tokens.append(("op", "under"))
+        else:
+            tokens.append((kind, text))
+    return tokens
+
+
+def parse_or(tokens, i):
+    node, i = parse_and(tokens, i)
+    while i < len(tokens) and tokens[i][0] == "OR":
+        right, i = parse_and(tokens, i + 1)
+        node = ("or", node, right)
+    return node, i
+
+
+def parse_and(tokens, i):
+    node, i = parse_not(tokens, i)
+    while i < len(tokens) and tokens[i][0] == "AND":
+        right, i = parse_not(tokens, i + 1)
+        node = ("and", node, right)
+    return node, i
+
+
+def parse_not(tokens, i):
+    if i >= len(tokens):
+        raise ValueError("query ended early")
+    kind, text = tokens[i]
+    if kind == "NOT":
+        node, i = parse_not(tokens, i + 1)
+        return ("not", node), i
+    if kind == "paren" and text == "(":
+        node, i = parse_or(tokens, i + 1)
+        if i >= len(tokens) or tokens[i] != ("paren", ")"):
+            raise ValueError("missing ) in query")
+        return node, i + 1
+    return parse_comparison(tokens, i)
+
+
+def parse_comparison(tokens, i):
+    if i + 3 > len(tokens):
+        raise ValueError("incomplete comparison in query")
+
+    (_, field), (opkind, op), (valkind, value) = tokens[i : i + 3]
+    field = field.lower()
+    if field not in FIELDS:
+        raise ValueError(
+            f"unknown field {field!r}, expected one of {', '.join(FIELDS)}"
+        )
+    if opkind != "op":
+        raise ValueError(f"expected an operator after {field!r}, got {op!r}")
+    if valkind not in ("word", "value"):
+        raise ValueError(f"expected a value after {field} {op}, got {value!r}")
+
+    kind = field_kind(field)
+    if op not in OPERATORS[kind]:
+        raise ValueError(
+            f"{field} doesn't support {op!r}, use one of {' '.join(OPERATORS[kind])}"
+        )
+    if kind == "numeric":
+        value = parse_number(value)
+    return ("cmp", field, op, value), i + 3
+
+
+def field_kind(field):
+    if field in NUMERIC_FIELDS:
+        return "numeric"
+    if field in TEXT_FIELDS:
+        return "text"
+    return "folder"
+
+
+def parse_number(value):
+    # "10s" -> 10.0, "500ms" -> 0.5, "2m" -> 120.0, "-3" -> -3.0
+    m = NUMBER_RE.fullmatch(value)
+    if m is None:
+        raise ValueError(f"expected a number, got {value!r}")
+    number, unit = m.groups()
+    return float(number) * UNITS[unit.lower()] if unit else float(number)
+
+
+# set operations on sorted sequences of song indices
+# ranges stay ranges where possible, and intersecting with a range is just a slice
+
+
+def intersect(a, b):
+    if isinstance(a, range) and isinstance(b, range):
+        start = max(a.start, b.start)
+        return range(start, max(start, min(a.stop, b.stop)))
+    if isinstance(a, range):
+        a, b = b, a
+    if isinstance(b, range):
+        return a[bisect_left(a, b.start) : bisect_left(a, b.stop)]
+    if len(a) > len(b):
+        a, b = b, a
+    return array("I", sorted(set(a).intersection(b)))
+
+
+def union(a, b):
+    if isinstance(a, range) and isinstance(b, range):
+        if a.start <= b.stop and b.start <= a.stop:  # overlapping or touching
+            return range(min(a.start, b.start), max(a.stop, b.stop))
+    return array("I", sorted(set(a).union(b)))
+
+
+def complement(a, n):
+    if isinstance(a, range):
+        return array("I", range(0, a.start)) + array("I", range(a.stop, n))
+    found = set(a)
+    return array("I", [ix for ix in range(n) if ix not in found])
@@ -0,0 +1,174 @@
+import os
+import re
+import threading
+from array import array
+from collections import Counter
+
+# search-as-you-type over the songs in a library
+# every song is indexed by the trigrams of "folder/name" (its parent folder and file name without extension),
+# plus the first one and two letters of each word so 1-2 letter queries work too
+
+CHUNK_SIZE = 512  # songs indexed per lock hold while building, ~10ms
+SCAN_FACTOR = 8  # verify up to limit * SCAN_FACTOR candidates before ranking
+FUZZY_MAX_POSTINGS = 50_000  # grams this common are useless for typo matching
+WORD_RE = re.compile(r"[^\W_]+")
+EMPTY = array("I")
+
+
+class SearchIndex:
+    """
+    trigram index of a library's songs, built in chunks on a background thread
+
+    search() can run at any point; until the build is done it only sees the songs indexed so far.
+    songs are indexed shortest name first, so posting lists are sorted by name length and a
+    search can stop scanning once it has enough matches.
+
+    stale() is True once the library has changed since the build; start() builds it again
+    """
+
+    def __init__(self, library):
+        self.library = library
+        self.version = None
+        self.texts = []  # searchable text of each entry
+        self.paths = []  # full path of each entry
+        self.postings = {}  # gram -> entry ids containing it
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stopped = threading.Event()
+        self.ready = threading.Event()
+
+    def start(self):
+        self.stopped.clear()
+        self.ready.clear()
+        self.thread = threading.Thread(
+            target=self.build, daemon=True, name="Search Index"
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def stale(self):
+        return self.library.version != self.version
+
+    def build(self):
+        with self.library.lock:
+            version = self.library.version
+            paths = list(self.library.songs())
+        pdir = self.library.pdir
+        entries = sorted(
+            ((search_text(os.path.relpath(path, pdir)), path) for path in paths),
+            key=lambda entry: len(entry[0]),
+        )
+
+        with self.lock:
+            self.version = version
+            self.texts = []
+            self.paths = []
+            self.postings = {}
+
+        for start in range(0, len(entries), CHUNK_SIZE):
+            if self.stopped.is_set():
+                return
+            with self.lock:
+                postings = self.postings
+                for text, path in entries[start : start + CHUNK_SIZE]:
+                    ix = len(self.texts)
+                    self.texts.append(text)
+                    self.paths.append(path)
+                    for gram in index_grams(text):
+                        try:
+                            postings[gram].append(ix)
+                        except KeyError:
+                            postings[gram] = array("I", [ix])
+        self.ready.set()
+
+    def search(self, query, limit=20):
+        # returns list of up to limit paths matching query, best match first
+        # every word in query must appear somewhere in the song's folder/name; if none do, falls back to typo-tolerant matching
+
+        tokens = query.casefold().split()
+        if not tokens:
+            return []
+
+        with self.lock:
+            lists = [
+                self.postings.get(gram, EMPTY)
+                for token in tokens
+                for gram in query_grams(token)
+            ]
+            candidates = min(lists, key=len)
+
+            found = []
+            texts = self.texts
+            for ix in candidates:
+                text = texts[ix]
+                if all(token in text for token in tokens):
+                    found.append(ix)
+                    if len(found) >= limit * SCAN_FACTOR:
+                        break
+            if not found:
+                return self.fuzzy(tokens, limit)
+
+            phrase = " ".join(tokens)
+            found.sort(key=lambda ix: rank(texts[ix], tokens, phrase))
+            return [self.paths[ix] for ix in found[:limit]]
+
+    def fuzzy(self, tokens, limit):
+        # ranks entries by how many of the query's trigrams they share
+        # only the rarer grams are counted, so a typo'd query stays cheap
+        grams = {gram for token in tokens for gram in trigrams(token)}
+        counts = Counter()
+        for gram in grams:
+            ixs = self.postings.get(gram, EMPTY)
+            if len(ixs) <= FUZZY_MAX_POSTINGS:
+                counts.update(ixs)
+
+        needed = max(1, len(grams) // 2)
+        best = sorted(
+            (ix for ix, n in counts.items() if n >= needed),
+            key=lambda ix: (-counts[ix], ix),
+        )
+        return [self.paths[ix] for ix in best[:limit]]
+
+
+# helper functions
+
+
+def search_text(relpath):
+    # "sfx/explosions/Big Boom.wav" -> "explosions/big boom"
+    folder, name = os.path.split(relpath)
+    return f"{os.path.basename(folder)}/{os.path.splitext(name)[0]}".casefold()
+
+
+def trigrams(text):
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def index_grams(text):
+    grams = trigrams(text)
+    for word in WORD_RE.findall(text):
+        grams.add("\0" + word[:1])
+        grams.add("\0" + word[:2])
+    return grams
+
+
+def query_grams(token):
+    if len(token) < 3:
+        return ["\0" + token]
+    return trigrams(token)
+
+
+def rank(text, tokens, phrase):
+    # sort key: file names starting with the query, then words starting with each token,
+    # then plain substring matches. ties go to the shorter (already first) entry
+    name = text.rpartition("/")[2]
+    if name.startswith(phrase):
+        return 0
+    words = WORD_RE.findall(text)
+    if all(any(word.startswith(token) for word in words) for token in tokens):
+        return 1
+    return 2
@@ -0,0 +1,310 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from functools import partial
+from os.path import join as pathjoin
+
+from macrodeck.MediaLibrary import (
+    MEDIA_EXTENSIONS,
+    compile_patterns,
+    ignored,
+    is_song,
+    is_subdir,
+    scan_dir,
+    scan_dir_cached,
+    walk,
+)
+
+# inotify constants from <sys/inotify.h>
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CREATE
+    | IN_DELETE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def load_inotify():
+    # returns libc if it has inotify, else None
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+LIBC = load_inotify()
+HAS_INOTIFY = LIBC is not None
+
+
+def LibraryWatcher(
+    library, ignore=None, patterns=None, extensions=MEDIA_EXTENSIONS, interval=2.0
+):
+    """
+    returns a watcher that keeps library up to date as files are added, removed or renamed
+
+    uses inotify on linux and falls back to polling dir mtimes everywhere else
+    ignore/patterns/extensions should match whatever was passed to index_library
+    """
+    if HAS_INOTIFY:
+        return InotifyWatcher(library, ignore, patterns, extensions)
+    return PollingWatcher(library, ignore, patterns, extensions, interval)
+
+
+class BaseWatcher:
+    def __init__(
+        self, library, ignore=None, patterns=None, extensions=MEDIA_EXTENSIONS
+    ):
+        self.library = library
+        self.ignore = ignore
+        self.extensions = extensions
+        self.matchers = compile_patterns(patterns)
+        self.scan = partial(
+            scan_dir,
+            library.pdir,
+            ignore=ignore,
+            matchers=self.matchers,
+            extensions=extensions,
+        )
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(
+            target=self.run, daemon=True, name="Library Watcher"
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        raise NotImplementedError
+
+    def sync(self, results, old_results=None, root=""):
+        """
+        applies the difference between a fresh scan and the library
+        old_results is the previous scan; dirs whose listing didn't change are skipped
+        """
+
+        lib = self.library
+
+        # dirs that disappeared
+        if old_results is None:
+            gone = [key for key in list(lib.keys) if is_subdir(key, root)]
+        else:
+            gone = list(old_results.keys())
+        for key in gone:
+            if key not in results:
+                lib.remove_dir(key)
+
+        for key, result in results.items():
+            if old_results is not None and result is old_results.get(key):
+                continue
+            songs = result[0]
+            current = set(lib.lib.get(key, ()))
+            wanted = set(songs)
+            for name in current - wanted:
+                lib.remove_song(key, name)
+            for name in songs:
+                if name not in current:
+                    lib.add_song(key, name)
+
+    def wanted(self, name, path, isdir):
+        if self.matchers and ignored(name, path, self.matchers):
+            return False
+        if isdir:
+            return self.ignore is None or name not in self.ignore
+        return is_song(name, self.extensions)
+
+
+class PollingWatcher(BaseWatcher):
+    """
+    rescans the library every interval seconds
+    each poll costs one stat per dir; only dirs whose mtime changed are listed again
+    """
+
+    def __init__(
+        self,
+        library,
+        ignore=None,
+        patterns=None,
+        extensions=MEDIA_EXTENSIONS,
+        interval=2.0,
+    ):
+        super().__init__(library, ignore, patterns, extensions)
+        self.interval = interval
+
+    def run(self):
+        results = None
+        while True:
+            try:
+                new_results = walk(
+                    "",
+                    partial(
+                        scan_dir_cached, self.library.pdir, self.scan, results or {}
+                    ),
+                )
+            except OSError:
+                # a dir vanished mid-scan; try again next time
+                new_results = None
+
+            if new_results is not None:
+                self.sync(new_results, results)
+                results = new_results
+
+            if self.stopped.wait(self.interval):
+                return
+
+
+class InotifyWatcher(BaseWatcher):
+    """
+    applies inotify events to the library as they arrive
+    one watch per dir; files are added when created or moved in, removed when deleted or moved out
+    """
+
+    def __init__(
+        self, library, ignore=None, patterns=None, extensions=MEDIA_EXTENSIONS
+    ):
+        super().__init__(library, ignore, patterns, extensions)
+        self.fd = None
+        self.wd2key = {}
+        self.key2wd = {}
+
+    def start(self):
+        self.fd = LIBC.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.wakeup_r, self.wakeup_w = os.pipe()
+        super().start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.stopped.set()
+            os.write(self.wakeup_w, b"x")
+        super().stop()
+        if self.fd is not None:
+            os.close(self.fd)
+            os.close(self.wakeup_r)
+            os.close(self.wakeup_w)
+            self.fd = None
+        self.wd2key = {}
+        self.key2wd = {}
+
+    def run(self):
+        self.resync()
+
+        while not self.stopped.is_set():
+            ready, _, _ = select.select([self.fd, self.wakeup_r], [], [])
+            if self.wakeup_r in ready:
+                return
+            for wd, mask, name in self.read_events():
+                self.handle(wd, mask, name)
+
+    def read_events(self):
+        buf = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = buf[offset : offset + length].rstrip(b"\0")
+            offset += length
+            yield wd, mask, os.fsdecode(name)
+
+    def handle(self, wd, mask, name):
+        if mask & IN_Q_OVERFLOW:
+            # kernel dropped events, so we can't trust the library anymore
+            self.resync()
+            return
+
+        if mask & IN_IGNORED:
+            key = self.wd2key.pop(wd, None)
+            if key is not None and self.key2wd.get(key) == wd:
+                self.key2wd.pop(key)
+            return
+
+        key = self.wd2key.get(wd)
+        if key is None or mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            return  # handled by the event in the parent dir
+
+        path = pathjoin(key, name)
+        isdir = bool(mask & IN_ISDIR)
+        if not self.wanted(name, path, isdir):
+            return
+
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            if isdir:
+                self.add_dir(path)
+            else:
+                self.library.add_song(key, name)
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            if isdir:
+                self.remove_dir(path)
+            else:
+                self.library.remove_song(key, name)
+
+    def add_watch(self, key):
+        wd = LIBC.inotify_add_watch(
+            self.fd, os.fsencode(pathjoin(self.library.pdir, key)), WATCH_MASK
+        )
+        if wd < 0:
+            return False
+        self.wd2key[wd] = key
+        self.key2wd[key] = wd
+        return True
+
+    def add_dir(self, root):
+        # watches and scans root and everything below it
+        # watches go on before each dir is listed so nothing created in between is missed
+
+        def scan(path):
+            self.add_watch(path)
+            return self.scan(path)
+
+        try:
+            results = walk(root, scan)
+        except OSError:
+            return  # dir vanished before we got to it; its delete event is on the way
+        self.sync(results, root=root)
+
+    def remove_dir(self, root):
+        for key in [key for key in self.key2wd if is_subdir(key, root)]:
+            wd = self.key2wd.pop(key)
+            self.wd2key.pop(wd, None)
+            LIBC.inotify_rm_watch(self.fd, wd)
+        self.library.remove_dir(root)
+
+    def resync(self):
+        for wd in list(self.wd2key):
+            LIBC.inotify_rm_watch(self.fd, wd)
+        self.wd2key = {}
+        self.key2wd = {}
+        self.add_dir("")
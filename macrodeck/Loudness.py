@@ -0,0 +1,267 @@
+import os
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    import soundfile
+
+    HAS_LOUDNESS = True
+except (ModuleNotFoundError, OSError):
+    HAS_LOUDNESS = False
+
+# integrated loudness (ITU-R BS.1770, in LUFS) of every media file, measured ahead of time so
+# playback only has to look up a gain
+#
+# K-weighting is applied to each 100 ms segment in the frequency domain instead of as a running
+# filter, which is within a fraction of a dB for music and needs nothing but numpy
+
+TARGET_LUFS = -18.0  # what every track is normalized to (the ReplayGain reference)
+# quiet tracks are raised at most this much, so their noise floor doesn't get blasted
+MAX_BOOST_DB = 6.0
+SEGMENT_SECS = 0.1  # gating blocks are 4 segments (400 ms) overlapping by 3
+READ_SEGMENTS = 600  # segments decoded at a time
+
+
+# sqlite cache of loudness, keyed by path + size + mtime
+# every row is also kept in memory, so gain() never touches the disk
+class LoudnessStore:
+    def __init__(self, filename="media_loudness.db"):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(filename, check_same_thread=False)
+        with self.lock, self.db:
+            self.db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS loudness (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime INTEGER NOT NULL,
+                    lufs REAL
+                )
+                """
+            )
+            rows = self.db.execute("SELECT path, size, mtime, lufs FROM loudness")
+            self.rows = {path: (size, mtime, lufs) for path, size, mtime, lufs in rows}
+
+    def lufs(self, path):
+        # returns loudness of path, or None if it hasn't been measured (or can't be)
+        row = self.rows.get(path)
+        return None if row is None else row[2]
+
+    def gain(self, path):
+        # returns the volume multiplier that brings path to TARGET_LUFS (1.0 if unknown)
+        lufs = self.lufs(path)
+        if lufs is None:
+            return 1.0
+        return 10 ** (min(TARGET_LUFS - lufs, MAX_BOOST_DB) / 20)
+
+    def measured(self, path, size, mtime):
+        # checks if path was measured at this size and mtime
+        row = self.rows.get(path)
+        return row is not None and row[:2] == (size, mtime)
+
+    def put_many(self, rows):
+        # rows: list of (path, size, mtime, lufs)
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO loudness (path, size, mtime, lufs) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        for path, size, mtime, lufs in rows:
+            self.rows[path] = (size, mtime, lufs)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class LoudnessScanner:
+    """
+    measures files on a background thread, across a process pool that lives as long as it does
+
+    add(paths) queues any iterable of paths (e.g. a library's songs); they're measured in the
+    order they were added. add(paths, urgent=True) jumps the queue, and is also measured in
+    between batches of a scan already running, for files the user just picked.
+    files already in the store at the same size and mtime are skipped.
+    nothing waits on this: until a file is measured, its gain is just 1
+    """
+
+    def __init__(self, store, workers=None, batch_size=16):
+        self.store = store
+        self.workers = workers
+        self.batch_size = batch_size
+        self.jobs = deque()
+        self.urgent = deque()
+        self.cond = threading.Condition()
+        self.pool = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.stopped.clear()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.thread = threading.Thread(
+            target=self.run, daemon=True, name="Loudness Scanner"
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        with self.cond:
+            self.cond.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    def add(self, paths, urgent=False):
+        with self.cond:
+            (self.urgent if urgent else self.jobs).append(paths)
+            self.cond.notify()
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not (self.urgent or self.jobs or self.stopped.is_set()):
+                    self.cond.wait()
+                if self.stopped.is_set():
+                    return
+                urgent = bool(self.urgent)
+                paths = (self.urgent if urgent else self.jobs).popleft()
+            self.scan(paths, urgent)
+
+    def scan(self, paths, urgent=False):
+        pending = []
+        for path in paths:
+            if self.stopped.is_set():
+                return
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if self.store.measured(path, stat.st_size, stat.st_mtime_ns):
+                continue
+
+            pending.append((path, stat.st_size, stat.st_mtime_ns))
+            if len(pending) >= self.batch_size:
+                self.measure_batch(pending)
+                pending = []
+                if not urgent:
+                    self.scan_urgent()
+
+        if pending and not self.stopped.is_set():
+            self.measure_batch(pending)
+
+    def scan_urgent(self):
+        while True:
+            with self.cond:
+                if not self.urgent:
+                    return
+                paths = self.urgent.popleft()
+            self.scan(paths, urgent=True)
+
+    def measure_batch(self, batch):
+        paths = [path for path, _, _ in batch]
+        results = self.pool.map(measure, paths)
+        self.store.put_many(
+            [
+                (path, size, mtime, lufs)
+                for (path, size, mtime), lufs in zip(batch, results)
+            ]
+        )
+
+
+# helper functions (measure runs in the worker processes)
+
+
+def measure(path):
+    # returns integrated loudness of path in LUFS, or None if it can't be read or is silent
+    try:
+        with soundfile.SoundFile(path) as f:
+            segment = int(f.samplerate * SEGMENT_SECS)
+            weight = k_weighting(segment, f.samplerate)
+            powers = [
+                segment_power(data, segment, weight)
+                for data in f.blocks(
+                    segment * READ_SEGMENTS, dtype="float32", always_2d=True
+                )
+            ]
+        return gated_loudness(np.concatenate(powers))
+    # an exception here would come out of pool.map and lose the batch's other results
+    except Exception:
+        return None
+
+
+def segment_power(data, segment, weight):
+    # returns the K-weighted mean square of each whole segment in data, summed over channels
+    n = len(data) // segment
+    segments = data[: n * segment].reshape(n, segment, data.shape[1])
+    spectrum = np.fft.rfft(segments, axis=1)
+    power = (spectrum.real**2 + spectrum.imag**2) * weight[:, None]
+    return power.sum(axis=(1, 2))
+
+
+def gated_loudness(powers):
+    # BS.1770 gating over 400 ms blocks: absolute gate at -70 LUFS, then relative at -10 LU
+    if len(powers) < 4:
+        return None
+    blocks = np.convolve(powers, np.ones(4) / 4, mode="valid")
+    with np.errstate(divide="ignore"):
+        loudness = -0.691 + 10 * np.log10(blocks)
+
+    blocks = blocks[loudness > -70]
+    if not len(blocks):
+        return None
+    relative = -0.691 + 10 * np.log10(blocks.mean()) - 10
+    loudness = -0.691 + 10 * np.log10(blocks)
+    return float(-0.691 + 10 * np.log10(blocks[loudness > relative].mean()))
+
+
+def k_weighting(n, rate):
+    # returns power gain of the K-weighting filter at each rfft bin of an n sample segment,
+    # scaled so the weighted sum of |rfft|^2 is the mean square of the filtered segment
+    z = np.exp(-1j * 2 * np.pi * np.fft.rfftfreq(n, 1 / rate) / rate)
+
+    # high shelf (+4 dB above ~1.5 kHz), the head's acoustic effect
+    a = 10 ** (4.0 / 40)
+    w0 = 2 * np.pi * 1500 / rate
+    alpha = np.sin(w0) / (2 / np.sqrt(2))
+    cos = np.cos(w0)
+    shelf = biquad(
+        z,
+        (
+            a * ((a + 1) + (a - 1) * cos + 2 * np.sqrt(a) * alpha),
+            -2 * a * ((a - 1) + (a + 1) * cos),
+            a * ((a + 1) + (a - 1) * cos - 2 * np.sqrt(a) * alpha),
+        ),
+        (
+            (a + 1) - (a - 1) * cos + 2 * np.sqrt(a) * alpha,
+            2 * ((a - 1) - (a + 1) * cos),
+            (a + 1) - (a - 1) * cos - 2 * np.sqrt(a) * alpha,
+        ),
+    )
+
+    # high pass at 38 Hz
+    w0 = 2 * np.pi * 38 / rate
+    alpha = np.sin(w0) / (2 * 0.5)
+    cos = np.cos(w0)
+    highpass = biquad(
+        z,
+        ((1 + cos) / 2, -(1 + cos), (1 + cos) / 2),
+        (1 + alpha, -2 * cos, 1 - alpha),
+    )
+
+    weight = np.abs(shelf * highpass) ** 2
+    # every rfft bin but DC (and Nyquist, for even n) stands for two bins of the full fft
+    weight[1 : (n + 1) // 2] *= 2
+    return weight / n**2
+
+
+def biquad(z, b, a):
+    # frequency response of a biquad at z = e^-jw
+    return (b[0] + b[1] * z + b[2] * z**2) / (a[0] + a[1] * z + a[2] * z**2)
@@ -0,0 +1,199 @@
+import threading
+import time
+
+from pynput.keyboard import Key, KeyCode
+
+# timed key sequences, recorded from the hotkey listener and replayed through a keyboard Controller
+#
+# a recording is a list of [delta_us, key, is_press]: delta_us is the time since the previous event
+# in microseconds, key is "<vk>" or a single char. it's stored as is in the button's arg
+#
+# playback schedules every event at an absolute deadline (start + sum of deltas / speed), so a late
+# wakeup delays one event instead of shifting everything after it
+
+# playback sleeps until this close to an event, then spins: windows sleeps in ~15 ms steps
+SPIN_SECS = 0.002
+
+
+class KeyRecorder:
+    """
+    records the keys physically pressed while the hotkey listener runs (keys the app sends
+    itself are never recorded)
+
+    start() begins a recording, stop() ends it and returns the events
+    """
+
+    def __init__(self, hotkeys):
+        self.hotkeys = hotkeys
+        self.events = []
+        self.last = None  # perf_counter_ns of the previous event
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            self.events = []
+            self.last = None
+        self.hotkeys.set_recorder(self.record)
+
+    def stop(self):
+        self.hotkeys.set_recorder(None)
+        with self.lock:
+            return trim(self.events)
+
+    def recording(self):
+        return self.hotkeys._recorder == self.record
+
+    def record(self, key, is_press):
+        # called from the listener thread
+        now = time.perf_counter_ns()
+        try:
+            key = encode_key(key)
+        except ValueError:
+            return
+        with self.lock:
+            # the wait before the first key isn't part of the macro
+            delta = 0 if self.last is None else (now - self.last) // 1000
+            self.last = now
+            self.events.append([delta, key, is_press])
+
+
+class Player:
+    """
+    plays one recording at a time on its own thread; playing while busy stops the current one
+    """
+
+    def __init__(self, keyboard):
+        self.keyboard = keyboard
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def playing(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def play(self, events, speed=1.0, hotkeys=None):
+        """
+        events are compiled (see compile_recording). hotkeys is the running MyGlobalHotKeys;
+        playback waits for the keys that triggered it to be released
+        """
+        self.stop()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self.run,
+            args=(events, speed, hotkeys, self.stopped),
+            daemon=True,
+            name="Macro Playback",
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def run(self, events, speed, hotkeys, stopped):
+        if hotkeys is not None:
+            hotkeys.wait_released()
+        play(events, self.keyboard, speed, stopped)
+
+
+# helper functions
+
+
+def play(events, keyboard, speed=1.0, stopped=None):
+    """
+    sends compiled events through keyboard, speed times as fast as they were recorded
+
+    returns False if stopped (a threading.Event) was set first. keys still held at the end
+    are released either way
+    """
+    if speed <= 0:
+        raise ValueError(f"speed must be positive, got {speed}")
+
+    held = set()
+    start = time.perf_counter()
+    elapsed_us = 0
+    try:
+        for delta_us, key, is_press in events:
+            # deadlines come from the exact (integer) total, so rounding can't drift either
+            elapsed_us += delta_us
+            if not wait_until(start + elapsed_us / 1e6 / speed, stopped):
+                return False
+            if is_press:
+                keyboard.press(key)
+                held.add(key)
+            else:
+                keyboard.release(key)
+                held.discard(key)
+        return True
+    finally:
+        for key in held:
+            keyboard.release(key)
+
+
+def wait_until(deadline, stopped=None):
+    # returns False if stopped is set before deadline (a perf_counter time)
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return True
+        if remaining > SPIN_SECS:
+            if stopped is None:
+                time.sleep(remaining - SPIN_SECS)
+            elif stopped.wait(remaining - SPIN_SECS):
+                return False
+
+
+def compile_recording(events):
+    """
+    returns events as (delta_us, pynput key, is_press) tuples, ready for play
+
+    :raises ValueError: if events aren't a recording
+    """
+    try:
+        return tuple(
+            (int(delta_us), decode_key(key), bool(is_press))
+            for delta_us, key, is_press in events
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"not a key recording: {e}") from None
+
+
+def describe(events):
+    presses = sum(1 for _, _, is_press in events if is_press)
+    seconds = sum(delta_us for delta_us, _, _ in events) / 1e6
+    return f"{presses} key presses over {seconds:.1f} s"
+
+
+def trim(events):
+    # drops releases of keys pressed before the recording started
+    pressed = set()
+    trimmed = []
+    carry = 0  # delta of dropped events, so the rest keep their timing
+    for delta_us, key, is_press in events:
+        if is_press:
+            pressed.add(key)
+        elif key not in pressed:
+            carry += delta_us
+            continue
+        trimmed.append([delta_us + carry if trimmed else 0, key, is_press])
+        carry = 0
+    return trimmed
+
+
+def encode_key(key):
+    if isinstance(key, Key):
+        key = key.value
+    if getattr(key, "vk", None) is not None:
+        return f"<{key.vk}>"
+    if key.char is not None:
+        return key.char
+    raise ValueError(f"can't record key: {key}")
+
+
+def decode_key(key):
+    if len(key) > 2 and key[0] == "<" and key[-1] == ">":
+        return KeyCode.from_vk(int(key[1:-1]))
+    if len(key) == 1:
+        return key
+    raise ValueError(f"bad key: {key!r}")
@@ -1,100 +1,646 @@
-import random
-import os
-from os.path import join as pathjoin  # aliasing so I don't confuse it with thread.join
-
-
-# class to index music within a folder and its subfolders
-class Library:
-    def __init__(self, pdir):
-        self.lib = {}
-        self.nsongs = 0
-        self.pdir = pdir  # parent dir
-        self.key2ix = {}  # track index of each key for convenience
-
-    def __getitem__(self, key):
-        return self.lib[key]
-
-    def __setitem__(self, key, value):
-        self.lib[key] = value
-
-    def finalize(self):
-        # cleans up and indexes self.lib and calculates metadata
-        # if Library is ever altered, this should run again
-
-        empty = []
-        self.index = []  # stores cumulative number of songs in each key
-        i = 0  # not enumerating bc I want to skip empty dirs
-        for key in self.lib.keys():
-            if len(self.lib[key]) == 0:
-                empty.append(key)
-            else:
-                self.nsongs += len(self.lib[key])
-                self.index.append(self.nsongs)
-                self.key2ix[key] = i
-                i += 1
-
-        for key in empty:
-            self.lib.pop(key)
-
-    def rsong(self):
-        # returns a random song
-        rint = random.randint(0, self.nsongs - 1)
-        return self.song_from_index(rint)
-
-    def song_from_index(self, ix):
-        # returns song path from index
-        # probably slow at scale
-        for i, key in enumerate(self.lib.keys()):
-            if ix < self.index[i]:
-                if i == 0:
-                    return pathjoin(
-                        self.pdir, key, self.lib[key][ix]
-                    )  # avoids index error below
-                return pathjoin(self.pdir, key, self.lib[key][ix - self.index[i - 1]])
-
-    def shuffle(self, dir=None):
-        # generator function; returns shuffled song indices
-        # if dir is specified, only returns indices from that dir
-
-        if dir is None:
-            start = 0
-            end = self.nsongs
-        else:
-            start = 0 if self.key2ix[dir] == 0 else self.index[self.key2ix[dir] - 1]
-            end = self.index[self.key2ix[dir]]
-
-        playlist = list(range(start, end))
-        random.shuffle(playlist)
-        i = 0
-        while i < len(playlist):
-            yield self.song_from_index(playlist[i])
-            i += 1
-
-
-# helper functions
-
-
-def index_library(path, lib=None, ignore=None):
-    # parse music library, create list of songs
-    # only checks for .mp3 files
-
-    outer_loop = False
-
-    if lib is None:
-        lib = Library(path)
-        path = ""
-        outer_loop = True
-    lib[path] = []
-
-    for name in os.listdir(pathjoin(lib.pdir, path)):
-        fullpath = pathjoin(path, name)
-        if os.path.isdir(pathjoin(lib.pdir, fullpath)) and (
-            ignore is None or name not in ignore
-        ):  # recurse unless it should be ignored
-            lib = index_library(fullpath, lib=lib, ignore=ignore)
-        elif name[-3:].lower() == "mp3":
-            lib[path].append(name)
-
-    if outer_loop:
-        lib.finalize()
-    return lib
+import fnmatch
+import json
+import os
+import random
+import re
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from os.path import join as pathjoin  # aliasing so I don't confuse it with thread.join
+
+CACHE_VERSION = 1  # bump whenever the cache layout changes
+MASK64 = (1 << 64) - 1
+
+# file types that count as songs. pass a different set to index_library to change it
+MEDIA_EXTENSIONS = frozenset((".mp3", ".ogg", ".flac", ".wav", ".m4a", ".opus"))
+
+
+# class to index music within a folder and its subfolders
+class Library:
+    def __init__(self, pdir):
+        self.lib = {}
+        self.nsongs = 0
+        self.pdir = pdir  # parent dir
+        self.key2ix = {}  # track index of each key for convenience
+        self.keys = []  # non-empty keys, in the same order as self.index
+        self.index = []  # stores cumulative number of songs in each key
+        self.subtree = {}  # (start, end) song range of every dir, including its subdirs
+        self.version = 0  # incremented whenever songs are added or removed
+        self.lock = threading.RLock()  # held while reading or updating the index
+        self.compacted = False  # if True, self.lib is a CompactSongs
+
+    def __getitem__(self, key):
+        return self.lib[key]
+
+    def __setitem__(self, key, value):
+        self.expand()
+        self.lib[key] = value
+
+    def compact(self):
+        # packs song names into a CompactSongs to save memory. run after finalize
+        # the library goes back to dict of lists the next time it's modified
+
+        with self.lock:
+            if not self.compacted:
+                self.lib = CompactSongs(self.lib, self.keys)
+                self.compacted = True
+
+    def expand(self):
+        # undoes compact
+        with self.lock:
+            if self.compacted:
+                self.lib = {key: songs for key, songs in self.lib.items()}
+                self.compacted = False
+
+    def finalize(self):
+        # cleans up and indexes self.lib and calculates metadata
+        # if self.lib is ever altered directly, this should run again
+        # (add_song/remove_song/remove_key keep the index up to date on their own)
+
+        self.expand()
+
+        # keys must be depth-first so every dir's subtree is one contiguous range of songs
+        self.lib = {key: self.lib[key] for key in dfs_order(self.lib.keys())}
+        self.subtree = {}
+        stack = []  # (key, first song) of dirs whose subtree hasn't ended yet
+
+        empty = []
+        self.nsongs = 0
+        self.index = []
+        self.keys = []
+        self.key2ix = {}
+        i = 0  # not enumerating bc I want to skip empty dirs
+        for key in self.lib.keys():
+            while stack and not is_subdir(key, stack[-1][0]):
+                parent, start = stack.pop()
+                self.subtree[parent] = (start, self.nsongs)
+            stack.append((key, self.nsongs))
+
+            if len(self.lib[key]) == 0:
+                empty.append(key)
+            else:
+                self.nsongs += len(self.lib[key])
+                self.index.append(self.nsongs)
+                self.keys.append(key)
+                self.key2ix[key] = i
+                i += 1
+
+        for parent, start in stack:
+            self.subtree[parent] = (start, self.nsongs)
+
+        for key in empty:
+            self.lib.pop(key)
+        self.version += 1
+
+    def add_song(self, key, name):
+        # adds a song to key without rebuilding the index
+        # returns False if it was already there
+
+        with self.lock:
+            self.expand()
+            i = self.key2ix.get(key)
+            if i is None:
+                i = self.insert_pos(key)
+                start = 0 if i == 0 else self.index[i - 1]
+                self.lib[key] = []
+                self.keys.insert(i, key)
+                self.index.insert(i, start)
+                self.reindex_keys(i)
+
+                # new (or emptied) dirs start out empty, right where their songs will go
+                parent = key
+                while parent not in self.subtree or self.is_empty_dir(parent):
+                    self.subtree[parent] = (start, start)
+                    if not parent:
+                        break
+                    parent = os.path.dirname(parent)
+            elif name in self.lib[key]:
+                return False
+
+            self.shift_subtrees(key, self.index[i], 1)
+            self.lib[key].append(name)
+            self.shift(i, 1)
+            return True
+
+    def remove_song(self, key, name):
+        # removes a song from key without rebuilding the index
+        # returns False if it wasn't there
+
+        with self.lock:
+            self.expand()
+            i = self.key2ix.get(key)
+            if i is None or name not in self.lib[key]:
+                return False
+
+            start = 0 if i == 0 else self.index[i - 1]
+            self.shift_subtrees(key, start + self.lib[key].index(name), -1)
+            self.lib[key].remove(name)
+            self.shift(i, -1)
+            if not self.lib[key]:
+                self.drop_key(i)
+            return True
+
+    def remove_key(self, key):
+        # removes key and all of its songs (not its subdirs)
+
+        with self.lock:
+            self.expand()
+            i = self.key2ix.get(key)
+            if i is None:
+                return
+            start = 0 if i == 0 else self.index[i - 1]
+            self.shift_subtrees(key, start, -len(self.lib[key]))
+            self.shift(i, -len(self.lib[key]))
+            self.drop_key(i)
+
+    def remove_dir(self, dir):
+        # removes dir and everything below it
+
+        with self.lock:
+            for key in [key for key in self.keys if is_subdir(key, dir)]:
+                self.remove_key(key)
+            for key in [key for key in self.subtree if is_subdir(key, dir)]:
+                self.subtree.pop(key)
+
+    def shift(self, i, delta):
+        # adds delta to the cumulative count of key i and every key after it
+        for j in range(i, len(self.index)):
+            self.index[j] += delta
+        self.nsongs += delta
+        self.version += 1
+
+    def is_empty_dir(self, dir):
+        start, end = self.subtree[dir]
+        return start == end
+
+    def shift_subtrees(self, key, pos, delta):
+        # updates subtree ranges after delta songs were added to/removed from key at song pos
+        # dirs containing key grow or shrink, dirs entirely after pos move
+        for other, (start, end) in self.subtree.items():
+            if is_subdir(key, other):
+                self.subtree[other] = (start, end + delta)
+            elif start > pos or (start == pos and delta > 0):
+                self.subtree[other] = (start + delta, end + delta)
+
+    def drop_key(self, i):
+        key = self.keys.pop(i)
+        self.index.pop(i)
+        self.lib.pop(key)
+        self.key2ix.pop(key)
+        self.reindex_keys(i)
+
+    def reindex_keys(self, start):
+        for j in range(start, len(self.keys)):
+            self.key2ix[self.keys[j]] = j
+
+    def insert_pos(self, key):
+        # new keys go right before their own subdirs if any are indexed,
+        # else right after the last key under their closest existing parent dir
+        for j, other in enumerate(self.keys):
+            if is_subdir(other, key):
+                return j
+
+        parent = key
+        while parent:
+            parent = os.path.dirname(parent)
+            last = None
+            for j, other in enumerate(self.keys):
+                if is_subdir(other, parent):
+                    last = j
+            if last is not None:
+                return last + 1
+        return len(self.keys)
+
+    def rsong(self, dir=None, recursive=False, tracks=None):
+        # returns a random song
+        # if dir is specified, only picks from that dir (and its subdirs if recursive)
+        # tracks is a sequence of song indices to pick from instead, e.g. a LibraryQuery result
+        with self.lock:
+            if tracks is None:
+                tracks = range(*self.song_range(dir, recursive))
+            return self.song_from_index(tracks[random.randrange(len(tracks))])
+
+    def songs(self):
+        # yields every song path in index order
+        with self.lock:
+            keys = list(self.keys)
+        for key in keys:
+            for name in self.lib.get(key, ()):
+                yield pathjoin(self.pdir, key, name)
+
+    def song_range(self, dir=None, recursive=False):
+        # returns (start, end) song indices of dir
+        # if recursive, the range also covers every subdir of dir
+
+        if dir is None:
+            return 0, self.nsongs
+        if recursive:
+            return self.subtree[dir]
+        i = self.key2ix[dir]
+        return (0 if i == 0 else self.index[i - 1]), self.index[i]
+
+    def song_from_index(self, ix):
+        # returns song path from index
+        # binary search over the cumulative index, so this is O(log(number of keys))
+        with self.lock:
+            if ix < 0 or ix >= self.nsongs:
+                raise IndexError(ix)
+
+            i = bisect_right(self.index, ix)
+            key = self.keys[i]
+            if self.compacted:
+                return pathjoin(self.pdir, key, self.lib.name(ix))
+            start = 0 if i == 0 else self.index[i - 1]
+            return pathjoin(self.pdir, key, self.lib[key][ix - start])
+
+    def shuffle(self, dir=None, seed=None, position=0, recursive=False, tracks=None):
+        # returns iterator of shuffled songs
+        # if dir is specified, only returns songs from that dir (and its subdirs if recursive)
+        # tracks is a sequence of song indices to shuffle instead, e.g. a LibraryQuery result
+        # order is generated lazily, so this is O(1) no matter how many songs there are
+        # pass the seed and position of an old shuffle to resume it
+
+        if tracks is None:
+            tracks = range(*self.song_range(dir, recursive))
+        return Shuffle(self, tracks, seed=seed, position=position)
+
+
+class CompactSongs:
+    """
+    read-only stand-in for Library.lib: maps key -> list of song names
+
+    all names live in one utf8 blob, with the start of each name in an offsets array,
+    so a million songs cost a few bytes of overhead each instead of a str object apiece.
+    lists (and paths) are only built when asked for
+    """
+
+    def __init__(self, lib, keys):
+        self.keys_ = [sys.intern(key) for key in keys]  # interned dir table
+        self.key2ix = {key: i for i, key in enumerate(self.keys_)}
+        self.first = array("I", [0])  # first song index of each key, plus the end
+        self.offsets = array("I", [0])  # byte offset of each name in blob, plus the end
+
+        blob = bytearray()
+        for key in self.keys_:
+            for name in lib[key]:
+                blob += name.encode("utf8")
+                self.offsets.append(len(blob))
+            self.first.append(len(self.offsets) - 1)
+        self.blob = bytes(blob)
+
+    def name(self, ix):
+        # returns the name of song ix (global index, same as Library.song_from_index)
+        return self.blob[self.offsets[ix] : self.offsets[ix + 1]].decode("utf8")
+
+    def __getitem__(self, key):
+        i = self.key2ix[key]
+        return [self.name(ix) for ix in range(self.first[i], self.first[i + 1])]
+
+    def get(self, key, default=None):
+        if key not in self.key2ix:
+            return default
+        return self[key]
+
+    def __contains__(self, key):
+        return key in self.key2ix
+
+    def __len__(self):
+        return len(self.keys_)
+
+    def __iter__(self):
+        return iter(self.keys_)
+
+    def keys(self):
+        return list(self.keys_)
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys_]
+
+
+class Shuffle:
+    """
+    iterator over some songs of a library in a random, non-repeating order
+
+    tracks is a sequence of song indices: a range for a dir, or a LibraryQuery result
+    (seed, position) is enough to resume the shuffle later
+    """
+
+    def __init__(self, library, tracks, seed=None, position=0):
+        self.library = library
+        self.tracks = tracks
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.position = position
+        self.order = Permutation(len(tracks), self.seed)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self.position < len(self.order):
+            ix = self.tracks[self.order[self.position]]
+            self.position += 1
+            try:
+                return self.library.song_from_index(ix)
+            except IndexError:
+                # library shrank since the shuffle started (see LibraryWatcher)
+                continue
+        raise StopIteration
+
+    def __len__(self):
+        return len(self.order)
+
+    def state(self):
+        return self.seed, self.position
+
+
+class Permutation:
+    """
+    keyed bijection over range(n)
+
+    a feistel network scrambles numbers with an even number of bits; values that land
+    outside range(n) are fed through again until they don't ("cycle walking").
+    memory is O(1) and any position can be looked up directly
+    """
+
+    ROUNDS = 6
+
+    def __init__(self, n, seed):
+        self.n = n
+        bits = max(2, (n - 1).bit_length())
+        bits += bits % 2
+        self.halfbits = bits // 2
+        self.halfmask = (1 << self.halfbits) - 1
+
+        rng = random.Random(seed)
+        self.roundkeys = [rng.getrandbits(64) for _ in range(self.ROUNDS)]
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if i < 0 or i >= self.n:
+            raise IndexError(i)
+
+        # domain is less than 4n, so this takes < 4 tries on average
+        x = self.encrypt(i)
+        while x >= self.n:
+            x = self.encrypt(x)
+        return x
+
+    def encrypt(self, x):
+        left = x >> self.halfbits
+        right = x & self.halfmask
+        for key in self.roundkeys:
+            left, right = right, left ^ (mix64(right ^ key) & self.halfmask)
+        return (left << self.halfbits) | right
+
+
+def mix64(x):
+    # splitmix64 finalizer
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+# helper functions
+
+
+def is_song(name, extensions=MEDIA_EXTENSIONS):
+    return os.path.splitext(name)[1].lower() in extensions
+
+
+def dfs_order(keys):
+    # returns keys reordered so every dir comes right before its subdirs
+    # siblings keep their original order, so keys that are already depth-first don't move
+
+    keys = list(keys)
+    keyset = set(keys)
+    children = {}
+    roots = []
+    for key in keys:
+        parent = key
+        while parent:
+            parent = os.path.dirname(parent)
+            if parent in keyset:
+                children.setdefault(parent, []).append(key)
+                break
+        else:
+            roots.append(key)
+
+    order = []
+    stack = roots[::-1]
+    while stack:
+        key = stack.pop()
+        order.append(key)
+        stack.extend(reversed(children.get(key, ())))
+    return order
+
+
+def is_subdir(key, parent):
+    # true if key is parent or is somewhere below it
+    return parent == "" or key == parent or key.startswith(parent + os.sep)
+
+
+def index_library(
+    path,
+    lib=None,
+    ignore=None,
+    patterns=None,
+    workers=None,
+    cache=None,
+    extensions=MEDIA_EXTENSIONS,
+):
+    # parse music library, create list of songs
+    # extensions: file extensions that count as songs (lowercase, with the dot)
+    # ignore: directory names to skip
+    # patterns: extra ignore patterns for files and dirs. strings are globs matched against
+    #   the entry name, compiled regexes are searched for in the path relative to the library
+    # workers: max number of threads scanning directories (None uses the executor default)
+    # cache: json file to save the index to. on later runs, only dirs whose mtime changed are rescanned
+
+    outer_loop = False
+
+    if lib is None:
+        lib = Library(path)
+        path = ""
+        outer_loop = True
+
+    matchers = compile_patterns(patterns)
+    scan = partial(
+        scan_dir, lib.pdir, ignore=ignore, matchers=matchers, extensions=extensions
+    )
+    if cache is not None:
+        settings = cache_settings(ignore, patterns, extensions)
+        cached = load_cache(cache, lib.pdir, path, settings)
+        scan = partial(scan_dir_cached, lib.pdir, scan, cached)
+
+    # dirs are scanned in whatever order the pool finishes them,
+    # then laid out depth-first so keys match a serial walk
+    results = walk(path, scan, workers)
+    stack = [path]
+    while stack:
+        key = stack.pop()
+        songs, subdirs = results[key][:2]
+        lib[key] = songs
+        stack.extend(reversed(subdirs))
+
+    if cache is not None:
+        # the cache is only a speedup; failing to write it shouldn't lose the scan
+        try:
+            save_cache(cache, lib.pdir, path, settings, results)
+        except OSError as e:
+            print(f"Couldn't save library cache {cache}: {e}")
+
+    if outer_loop:
+        lib.finalize()
+    return lib
+
+
+def walk(path, scan, workers=None):
+    # runs scan on path and every subdir it returns, fanned out over a thread pool
+    # returns dict of path -> scan result
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(scan, path): path}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                results[key] = future.result()
+                for subdir in results[key][1]:
+                    pending[pool.submit(scan, subdir)] = subdir
+    return results
+
+
+def scan_dir(pdir, path, ignore=None, matchers=(), extensions=MEDIA_EXTENSIONS):
+    # lists one directory, returns (songs, subdirs)
+    # scandir gives us the file type from the directory listing, so no extra stat per entry
+
+    songs = []
+    subdirs = []
+    with os.scandir(pathjoin(pdir, path)) as entries:
+        for entry in entries:
+            name = entry.name
+            fullpath = pathjoin(path, name)
+            if matchers and ignored(name, fullpath, matchers):
+                continue
+            if entry.is_dir() and (
+                ignore is None or name not in ignore
+            ):  # recurse unless it should be ignored
+                subdirs.append(fullpath)
+            elif is_song(name, extensions):
+                songs.append(name)
+    return songs, subdirs
+
+
+def scan_dir_cached(pdir, scan, cached, path):
+    # like scan_dir, but reuses the cached listing if the dir hasn't changed since
+    # returns (songs, subdirs, mtime)
+    # adding, removing or renaming an entry updates the dir's mtime, so one stat is enough
+
+    mtime = os.stat(pathjoin(pdir, path)).st_mtime_ns
+    entry = cached.get(path)
+    if entry is not None and entry[2] == mtime:
+        return entry
+    songs, subdirs = scan(path)
+    return songs, subdirs, mtime
+
+
+def cache_settings(ignore, patterns, extensions=MEDIA_EXTENSIONS):
+    # json-friendly summary of the scan settings. a cache made with different settings is discarded
+
+    return {
+        "extensions": sorted(extensions),
+        "ignore": None if ignore is None else sorted(ignore),
+        "patterns": [
+            pattern if isinstance(pattern, str) else [pattern.pattern, pattern.flags]
+            for pattern in (patterns or [])
+        ],
+    }
+
+
+def load_cache(filename, pdir, path, settings):
+    # returns dict of path -> (songs, subdirs, mtime)
+    # returns an empty dict (full rescan) if the cache is missing, stale, or corrupt
+
+    try:
+        with open(filename, "r", encoding="utf8") as f:
+            data = json.load(f)
+
+        # valid json isn't necessarily a cache: check the shape before trusting any of it
+        if not isinstance(data, dict) or not isinstance(data.get("dirs"), dict):
+            raise TypeError("not a library cache")
+
+        if (
+            data["version"] != CACHE_VERSION
+            or data["pdir"] != os.path.abspath(pdir)
+            or data["root"] != path
+            or data["settings"] != settings
+        ):
+            print("Library cache is out of date, rescanning")
+            return {}
+
+        cached = {}
+        for key, entry in data["dirs"].items():
+            if not (isinstance(entry, list) and len(entry) == 3):
+                raise TypeError(key)
+            songs, subdirs, mtime = entry
+            if not (
+                isinstance(songs, list)
+                and isinstance(subdirs, list)
+                and isinstance(mtime, int)
+            ):
+                raise TypeError(key)
+            cached[key] = (songs, subdirs, mtime)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError):
+        print(f"Couldn't load library cache {filename}, rescanning")
+        return {}
+
+    return cached
+
+
+def save_cache(filename, pdir, path, settings, results):
+    data = {
+        "version": CACHE_VERSION,
+        "pdir": os.path.abspath(pdir),
+        "root": path,
+        "settings": settings,
+        "dirs": results,
+    }
+
+    # write to a temp file first so a crash can't leave a half-written cache behind
+    tmp = f"{filename}.tmp"
+    with open(tmp, "w", encoding="utf8") as f:
+        json.dump(data, f)
+    os.replace(tmp, filename)
+
+
+def compile_patterns(patterns):
+    # returns list of (regex, match_fullpath) tuples
+
+    if patterns is None:
+        return []
+
+    matchers = []
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            matchers.append((re.compile(fnmatch.translate(pattern)), False))
+        else:
+            matchers.append((pattern, True))
+    return matchers
+
+
+def ignored(name, fullpath, matchers):
+    for regex, match_fullpath in matchers:
+        if match_fullpath:
+            if regex.search(fullpath):
+                return True
+        elif regex.match(name):
+            return True
+    return False
@@ -0,0 +1,228 @@
+import os
+import sqlite3
+import threading
+import wave
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+
+try:
+    import mutagen
+
+    HAS_MUTAGEN = True
+except ModuleNotFoundError:
+    HAS_MUTAGEN = False
+
+TAG_FIELDS = ("duration", "title", "artist", "track_gain", "album_gain")
+
+
+# sqlite cache of song metadata, keyed by path + mtime
+# safe to share between threads
+class TagStore:
+    def __init__(self, filename="library_tags.db"):
+        self.lock = threading.Lock()
+        self.version = 0  # incremented whenever rows are written or deleted
+        self.db = sqlite3.connect(filename, check_same_thread=False)
+        with self.lock, self.db:
+            self.db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tags (
+                    path TEXT PRIMARY KEY,
+                    mtime INTEGER NOT NULL,
+                    duration REAL,
+                    title TEXT,
+                    artist TEXT,
+                    track_gain REAL,
+                    album_gain REAL
+                )
+                """
+            )
+
+    def get(self, path):
+        # returns dict of tags, or None if this song hasn't been read yet
+        with self.lock:
+            row = self.db.execute(
+                f"SELECT {', '.join(TAG_FIELDS)} FROM tags WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(TAG_FIELDS, row))
+
+    def mtimes(self):
+        # returns dict of path -> mtime of every stored song
+        with self.lock:
+            return dict(self.db.execute("SELECT path, mtime FROM tags"))
+
+    def rows(self):
+        # returns dict of path -> tuple of tags (in TAG_FIELDS order) of every stored song
+        with self.lock:
+            cursor = self.db.execute(f"SELECT path, {', '.join(TAG_FIELDS)} FROM tags")
+            return {row[0]: row[1:] for row in cursor}
+
+    def put_many(self, rows):
+        # rows: iterable of (path, mtime, tags)
+        with self.lock, self.db:
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO tags (path, mtime, {', '.join(TAG_FIELDS)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(TAG_FIELDS))})",
+                [
+                    (path, mtime, *[tags.get(field) for field in TAG_FIELDS])
+                    for path, mtime, tags in rows
+                ],
+            )
+            self.version += 1
+
+    def delete_many(self, paths):
+        paths = list(paths)
+        if not paths:
+            return
+        with self.lock, self.db:
+            self.db.executemany(
+                "DELETE FROM tags WHERE path = ?", [(path,) for path in paths]
+            )
+            self.version += 1
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class TagScanner:
+    """
+    keeps the tags of every song in a library up to date on a background thread, parsing files
+    across a process pool
+
+    the first pass checks every song and skips the ones whose path and mtime are already in the store.
+    after that it looks at the library every interval seconds, and when songs were added or removed
+    it reads the new ones and deletes the rows of songs that are gone
+
+    a song is playable straight away, TagStore.get just returns None until it's read.
+    done is set once the first pass has ended, whether or not it finished
+    """
+
+    def __init__(self, library, store, workers=None, batch_size=256, interval=2.0):
+        self.library = library
+        self.store = store
+        self.workers = workers
+        self.batch_size = batch_size
+        self.interval = interval
+        self.thread = None
+        self.stopped = threading.Event()
+        self.done = threading.Event()
+
+    def start(self):
+        self.stopped.clear()
+        self.done.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True, name="Tag Scanner")
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        version = None
+        while True:
+            if self.library.version != version:
+                version = self.library.version
+                try:
+                    self.scan(first=not self.done.is_set())
+                except BrokenExecutor:
+                    # a worker died (e.g. a file crashed the parser); try again on the next change
+                    print("Tag scanner worker died, some songs weren't tagged")
+                finally:
+                    self.done.set()
+            if self.stopped.wait(self.interval):
+                return
+
+    def scan(self, first):
+        # the watcher doesn't report edits, so only the first pass checks mtimes of known songs
+        known = self.store.mtimes()
+        with self.library.lock:
+            paths = list(self.library.songs())
+
+        pending = []
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for path in paths:
+                if self.stopped.is_set():
+                    return
+                if not first and path in known:
+                    continue
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                if known.get(path) == mtime:
+                    continue
+
+                pending.append((path, mtime))
+                if len(pending) >= self.batch_size:
+                    self.read_batch(pool, pending)
+                    pending = []
+
+            if pending and not self.stopped.is_set():
+                self.read_batch(pool, pending)
+
+        # songs deleted or moved away since their tags were read
+        self.store.delete_many(known.keys() - set(paths))
+
+    def read_batch(self, pool, batch):
+        paths = [path for path, _ in batch]
+        results = pool.map(read_tags, paths, chunksize=16)
+        self.store.put_many(
+            (path, mtime, tags) for (path, mtime), tags in zip(batch, results)
+        )
+
+
+# helper functions (these run in the worker processes)
+
+
+def read_tags(path):
+    # returns dict of tags; fields we can't read are None
+
+    tags = dict.fromkeys(TAG_FIELDS)
+    try:
+        if HAS_MUTAGEN:
+            read_mutagen(path, tags)
+        elif path.lower().endswith(".wav"):
+            with wave.open(path, "rb") as f:
+                tags["duration"] = f.getnframes() / f.getframerate()
+    # mutagen has its own exception for each format; a corrupt file just keeps None tags
+    except Exception:
+        pass
+    return tags
+
+
+def read_mutagen(path, tags):
+    f = mutagen.File(path, easy=True)
+    if f is None:
+        return
+    if f.info is not None:
+        tags["duration"] = f.info.length
+    if f.tags is None:
+        return
+
+    tags["title"] = first_tag(f.tags, "title")
+    tags["artist"] = first_tag(f.tags, "artist")
+    tags["track_gain"] = parse_gain(first_tag(f.tags, "replaygain_track_gain"))
+    tags["album_gain"] = parse_gain(first_tag(f.tags, "replaygain_album_gain"))
+
+
+def first_tag(tags, key):
+    try:
+        values = tags[key]
+    except (KeyError, ValueError):
+        return None
+    if isinstance(values, list):
+        return str(values[0]) if values else None
+    return str(values)
+
+
+def parse_gain(value):
+    # "-6.52 dB" -> -6.52
+    if value is None:
+        return None
+    try:
+        return float(value.lower().replace("db", "").strip())
+    except ValueError:
+        return None
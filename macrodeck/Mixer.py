@@ -0,0 +1,280 @@
+import collections
+import os
+import threading
+
+try:
+    import numpy as np
+    import soundfile
+
+    HAS_MIXER = True
+except (ModuleNotFoundError, OSError):
+    HAS_MIXER = False
+
+# software mixer: every voice is summed into one output stream in numpy blocks,
+# so overlapping sounds share one sink instead of each having a libvlc player
+
+STREAM_BLOCK = 8192  # frames decoded at a time for music
+STREAM_BUFFER = 3  # blocks decoded ahead of playback
+# how far the music gain moves toward its target per block, so ducking doesn't click
+DUCK_STEP = 0.05
+
+
+class Mixer:
+    """
+    mixes voices into a sink (see AudioSinks)
+
+    effects are short clips from a ClipCache. music voices stream from disk on a decoder thread
+    while any effect plays, music is turned down to duck (0-1); on_duck(True/False) is called
+    when that starts and stops so music played elsewhere (libvlc) can follow. it runs on its own
+    thread, since the audio callback mustn't wait on anything
+
+    volume is global (0-100), on top of each voice's own volume
+    """
+
+    def __init__(self, sink, cache, volume=50, duck=0.3):
+        self.sink = sink
+        self.cache = cache
+        self.rate = sink.rate
+        self.channels = sink.channels
+        self.volume = volume
+        self.duck = duck
+        self.music_gain = 1.0
+        self.ducked = False
+        self.on_duck = None
+        self.duck_changed = threading.Event()
+        self.voices = []
+        self.lock = threading.Lock()
+
+        self.decoder = threading.Thread(
+            target=self.decode_streams, daemon=True, name="Mixer Decoder"
+        )
+        self.ducker = threading.Thread(
+            target=self.report_ducks, daemon=True, name="Mixer Duck"
+        )
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+        self.decoder.start()
+        self.ducker.start()
+        sink.start(self.read)
+
+    def play(self, path, volume=100, music=False):
+        # returns MixerVoice, or None if path can't be played (e.g. too long to be an effect)
+        if music:
+            try:
+                voice = StreamVoice(path, self.rate, self.channels, volume)
+            except RuntimeError:  # soundfile can't open it
+                return None
+        else:
+            clip = self.cache.get(path)
+            if clip is None:
+                return None
+            voice = ClipVoice(clip, self.channels, volume)
+
+        with self.lock:
+            self.voices.append(voice)
+        self.wakeup.set()
+        print(f"Playing {os.path.basename(path)}".encode("utf8"))
+        return voice
+
+    def stop(self):
+        with self.lock:
+            for voice in self.voices:
+                voice.stop()
+            self.voices = []
+
+    def playing(self):
+        return bool(self.voices)
+
+    def set_volume(self, value):
+        self.volume = value
+
+    def close(self):
+        self.stop()
+        self.sink.stop()
+        self.stopped.set()
+        self.wakeup.set()
+        self.duck_changed.set()
+        self.decoder.join()
+        self.ducker.join()
+
+    def read(self, frames):
+        # source for the sink
+        with self.lock:
+            voices = self.voices = [voice for voice in self.voices if voice.playing()]
+
+        ducked = any(not voice.music for voice in voices)
+        target = self.duck if ducked else 1.0
+        start = self.music_gain
+        if abs(target - start) <= DUCK_STEP:
+            self.music_gain = target
+        else:
+            self.music_gain = start + DUCK_STEP * np.sign(target - start)
+        music_gain = np.linspace(start, self.music_gain, frames, dtype=np.float32)
+        music_gain = music_gain.reshape(-1, 1)
+
+        out = np.zeros((frames, self.channels), dtype=np.float32)
+        for voice in voices:
+            block = voice.read(frames)
+            gain = voice.volume / 100
+            if voice.music:
+                out[: len(block)] += block * (gain * music_gain[: len(block)])
+            else:
+                out[: len(block)] += block * gain
+
+        out *= self.volume / 100
+        np.clip(out, -1.0, 1.0, out=out)
+
+        if ducked != self.ducked:
+            self.ducked = ducked
+            self.duck_changed.set()
+        if any(voice.music and voice.wants_data() for voice in voices):
+            self.wakeup.set()
+        return (out * 32767).astype("<i2").tobytes()
+
+    def report_ducks(self):
+        # calls on_duck for the audio thread. changes that come and go between wakeups are skipped
+        reported = False
+        while not self.stopped.is_set():
+            self.duck_changed.wait()
+            self.duck_changed.clear()
+            ducked = self.ducked
+            if ducked != reported and self.on_duck is not None:
+                reported = ducked
+                self.on_duck(ducked)
+
+    def decode_streams(self):
+        while not self.stopped.is_set():
+            self.wakeup.wait()
+            self.wakeup.clear()
+            with self.lock:
+                streams = [voice for voice in self.voices if voice.music]
+            for voice in streams:
+                voice.fill()
+
+
+class MixerVoice:
+    """
+    handle to a sound in a Mixer. volume is 0-100
+    """
+
+    music = False
+
+    def __init__(self, volume):
+        self.volume = volume
+        self.stopped = False
+
+    def set_volume(self, value):
+        self.volume = value
+
+    def stop(self):
+        self.stopped = True
+
+    def playing(self):
+        return not self.stopped and not self.finished()
+
+    def finished(self):
+        raise NotImplementedError
+
+    def read(self, frames):
+        # returns up to frames of float32 samples, shape (n, channels)
+        raise NotImplementedError
+
+
+class ClipVoice(MixerVoice):
+    def __init__(self, clip, channels, volume):
+        super().__init__(volume)
+        self.pcm = np.frombuffer(clip.pcm, dtype="<i2").reshape(-1, channels)
+        self.pos = 0
+
+    def finished(self):
+        return self.pos >= len(self.pcm)
+
+    def read(self, frames):
+        block = self.pcm[self.pos : self.pos + frames]
+        self.pos += frames
+        return block.astype(np.float32) / 32768
+
+
+class StreamVoice(MixerVoice):
+    """
+    music voice, decoded a few blocks ahead by the mixer's decoder thread
+    """
+
+    music = True
+
+    def __init__(self, path, rate, channels, volume):
+        super().__init__(volume)
+        self.file = soundfile.SoundFile(path)
+        self.channels = channels
+        self.resampler = Resampler(self.file.samplerate, rate)
+        self.blocks = collections.deque()  # decoded, not played yet
+        self.current = np.zeros((0, channels), dtype=np.float32)
+        self.eof = False
+        self.fill()
+
+    def wants_data(self):
+        return not self.eof and len(self.blocks) < STREAM_BUFFER
+
+    def fill(self):
+        # runs on the decoder thread
+        while self.wants_data() and not self.stopped:
+            data = self.file.read(STREAM_BLOCK, dtype="float32", always_2d=True)
+            if data.shape[1] != self.channels:
+                data = np.repeat(
+                    data.mean(axis=1, keepdims=True), self.channels, axis=1
+                )
+            self.blocks.append(self.resampler(data))
+            # only after the last block is in, or the voice could look finished too early
+            if len(data) < STREAM_BLOCK:
+                self.file.close()
+                self.eof = True
+
+    def finished(self):
+        return self.eof and not self.blocks and not len(self.current)
+
+    def read(self, frames):
+        parts = []
+        while frames > 0:
+            if not len(self.current):
+                if not self.blocks:
+                    break  # decoder is behind; play silence for the rest
+                self.current = self.blocks.popleft()
+            parts.append(self.current[:frames])
+            frames -= len(parts[-1])
+            self.current = self.current[len(parts[-1]) :]
+        if not parts:
+            return self.current[:0]
+        return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+
+class Resampler:
+    """
+    linear interpolation from src_rate to rate across consecutive blocks
+    """
+
+    def __init__(self, src_rate, rate):
+        self.step = src_rate / rate
+        self.passthrough = src_rate == rate
+        self.phase = 0.0  # position of the next output sample, relative to self.tail
+        self.tail = None  # input samples still needed for the next block
+
+    def __call__(self, data):
+        if self.passthrough:
+            return data
+        if self.tail is not None:
+            data = np.concatenate([self.tail, data])
+        if len(data) < 2:
+            self.tail = data
+            return data[:0]
+
+        n = int((len(data) - 1 - self.phase) / self.step) + 1
+        x = self.phase + np.arange(n) * self.step
+        i = x.astype(np.int64)
+        frac = (x - i)[:, None].astype(np.float32)
+        out = data[i] * (1 - frac) + data[np.minimum(i + 1, len(data) - 1)] * frac
+
+        end = self.phase + n * self.step
+        keep = int(end)
+        self.tail = data[keep:]
+        self.phase = end - keep
+        return out
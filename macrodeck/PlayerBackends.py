@@ -0,0 +1,212 @@
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+try:
+    import vlc
+
+    HAS_VLC = True
+except ModuleNotFoundError:
+    HAS_VLC = False
+
+# backends do the actual playing for VLCPlayer
+#
+# a backend makes players with new_player(). every player has:
+#   load(path), play(), pause(), stop(), playing() -> bool, set_volume(0-100)
+#   preload(path): load(path), plus whatever makes a later play() start faster
+#   on_end: called with the player when its media finishes on its own (not when stopped)
+# and the backend has prefetch(path), which warms path up so the first load of it is fast
+#
+# on_end never runs on a thread that's inside the backend, so it can safely start the next track
+
+MEDIA_CACHE_SIZE = 64  # parsed Media objects kept by VLCBackend
+
+
+class VLCBackend:
+    """
+    plays through libvlc
+
+    libvlc sends MediaPlayerEndReached from its own thread and deadlocks if you touch a
+    player from there, so events are handed to a thread that sleeps until one arrives
+
+    prefetched Media are kept in an LRU and reused by load() until their file changes
+    """
+
+    def __init__(self):
+        self.instance = vlc.Instance()
+        # path -> (mtime, Media), least recently used first
+        self.media_cache = OrderedDict()
+        self.media_lock = threading.Lock()
+        self.events = queue.SimpleQueue()
+        self.thread = threading.Thread(
+            target=self.dispatch, daemon=True, name="VLC Events"
+        )
+        self.thread.start()
+
+    def new_player(self):
+        return VLCMediaPlayer(self)
+
+    def media(self, path):
+        # returns a Media for path, the prefetched one if there is one
+        with self.media_lock:
+            entry = self.media_cache.get(path)
+            if entry is not None and entry[0] == mtime(path):
+                self.media_cache.move_to_end(path)
+                return entry[1]
+        return self.instance.media_new(path)
+
+    def prefetch(self, path):
+        # opens and parses path (libvlc does the parsing in the background)
+        modified = mtime(path)
+        if modified is None:
+            return
+        with self.media_lock:
+            entry = self.media_cache.get(path)
+            if entry is not None and entry[0] == modified:
+                self.media_cache.move_to_end(path)
+                return
+
+        media = self.instance.media_new(path)
+        media.parse_with_options(vlc.MediaParseFlag.local, 0)
+        with self.media_lock:
+            self.media_cache[path] = (modified, media)
+            self.media_cache.move_to_end(path)
+            while len(self.media_cache) > MEDIA_CACHE_SIZE:
+                self.media_cache.popitem(last=False)
+
+    def dispatch(self):
+        while True:
+            player = self.events.get()
+            if player.on_end is not None:
+                player.on_end(player)
+
+
+class VLCMediaPlayer:
+    def __init__(self, backend):
+        self.backend = backend
+        self.player = backend.instance.media_player_new()
+        self.on_end = None
+        self.player.event_manager().event_attach(
+            vlc.EventType.MediaPlayerEndReached, self.end_reached
+        )
+
+    def load(self, path):
+        self.player.set_media(self.backend.media(path))
+
+    def preload(self, path):
+        # opens and parses the file in the background, so play() doesn't have to
+        self.backend.prefetch(path)
+        self.player.set_media(self.backend.media(path))
+
+    def play(self):
+        self.player.play()
+
+    def pause(self):
+        self.player.pause()
+
+    def stop(self):
+        self.player.stop()
+
+    def playing(self):
+        return self.player.get_state() == vlc.State.Playing
+
+    def set_volume(self, value):
+        self.player.audio_set_volume(value)
+
+    def end_reached(self, event):
+        # runs on libvlc's thread
+        self.backend.events.put(self)
+
+
+class FakeBackend:
+    """
+    in-memory backend that plays nothing, for tests and running without libvlc
+
+    every call is appended to log as (player number, method, arg), with None as the number for
+    calls on the backend. media only ends when finish() is called on the player (or on the
+    backend, for every playing player)
+    """
+
+    def __init__(self):
+        self.players = []
+        self.log = []
+        self.prefetched = set()
+
+    def new_player(self):
+        player = FakePlayer(self, len(self.players))
+        self.players.append(player)
+        return player
+
+    def prefetch(self, path):
+        self.log.append((None, "prefetch", path))
+        self.prefetched.add(path)
+
+    def finish(self):
+        # on_end starts the next track on another player, which must keep playing
+        playing = [player for player in self.players if player.state == "playing"]
+        for player in playing:
+            player.finish()
+
+
+class FakePlayer:
+    def __init__(self, backend, number):
+        self.backend = backend
+        self.number = number
+        self.path = None
+        self.state = "stopped"
+        self.volume = 100
+        self.on_end = None
+
+    def record(self, method, arg=None):
+        self.backend.log.append((self.number, method, arg))
+
+    def load(self, path):
+        self.record("load", path)
+        self.path = path
+        self.state = "stopped"
+
+    def preload(self, path):
+        self.record("preload", path)
+        self.path = path
+        self.state = "stopped"
+
+    def play(self):
+        self.record("play", self.path)
+        if self.path is not None:
+            self.state = "playing"
+
+    def pause(self):
+        self.record("pause")
+        if self.state == "playing":
+            self.state = "paused"
+        elif self.state == "paused":
+            self.state = "playing"  # libvlc's pause toggles too
+
+    def stop(self):
+        self.record("stop")
+        self.state = "stopped"
+
+    def playing(self):
+        return self.state == "playing"
+
+    def set_volume(self, value):
+        self.record("set_volume", value)
+        self.volume = value
+
+    def finish(self):
+        # pretend the media played to the end
+        self.state = "ended"
+        if self.on_end is not None:
+            self.on_end(self)
+
+
+# helper functions
+
+
+def mtime(path):
+    # returns path's modification time, or None if it doesn't exist
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
@@ -1,89 +1,506 @@
-import os
-
-try:
-    import vlc
-
-    HAS_VLC = True
-except ModuleNotFoundError:
-    HAS_VLC = False
-
-
-# class that maintains VLC Players and tracks their states
-# if i was smart this would inherit from vlc.instance
-class VLCPlayer:
-    def __init__(self):
-        self.vlc_instance = vlc.Instance()
-        self.players = []
-        self.nplayers = 0
-        self.playlist_mode = False
-        self.playlist_paused = False
-        self.volume = 50
-
-    def __call__(self, path, new=False):
-        if new or not self.nplayers:
-            player = self.new_player()
-            player.audio_set_volume(self.volume)
-            self.players.append(player)
-            self.nplayers += 1
-        else:
-            player = self.players[0]
-
-        player.set_media(self.vlc_instance.media_new(path))
-        print(f"Playing {os.path.basename(path)}".encode("utf8"))
-        player.play()
-
-    def new_player(self):
-        return self.vlc_instance.media_player_new()
-
-    def stop(self):
-        for player in self.players:
-            player.stop()
-
-    def reset(self):
-        self.stop()
-        self.players = []
-        self.nplayers = 0
-        self.playlist_mode = False
-        self.playlist_paused = False
-
-    def playing(self, player=None):
-        # checks if the given player is playing,
-        # if none given, checks the default player
-
-        if self.nplayers == 0:
-            return False
-        elif player is None:
-            player = self.default_player()
-        return player.get_state() == vlc.State.Playing
-
-    def default_player(self):
-        # returns the default player if it exists, else None
-        if not self.nplayers:
-            return None
-        return self.players[0]
-
-    def toggle_pause(self):
-        # works only for default player
-
-        if not self.nplayers:
-            return
-
-        player = self.default_player()
-        if self.playing(player):
-            player.pause()
-            if self.playlist_mode:
-                self.playlist_paused = True
-        else:
-            player.play()
-            if self.playlist_mode:
-                self.playlist_paused = False
-
-    def set_volume(self, value):
-        # works only for default player
-        self.volume = value
-
-        if not self.nplayers:
-            return
-
-        player = self.default_player()
-        player.audio_set_volume(value)
+import os
+import threading
+from collections import deque
+from functools import partial
+
+from macrodeck.Fader import Fader
+from macrodeck.PlayerBackends import HAS_VLC, VLCBackend
+
+STEAL_POLICIES = ("oldest", "quietest", "priority")
+MAX_VOLUME = 200  # libvlc amplifies past 100, which loudness gains can need
+# ducking ramps the default player down over about as long as the mixer takes with its own music
+DUCK_SECONDS = 0.1
+
+
+# class that maintains VLC Players and tracks their states
+# the actual playing is done by a backend (see PlayerBackends), so tests can swap in a FakeBackend
+#
+# in playlist mode, tracks come from an up-next queue (see enqueue) and then from self.playlist.
+# the next track is preloaded on a standby player while the current one plays,
+# so switching tracks is just a play() on a player that's ready to go
+#
+# sounds played with new=True overlap the default player on a fixed pool of voices (see VoicePool)
+# clips is an optional ClipPlayer for short sounds that are played from memory instead (see play_clip)
+# mixer is an optional Mixer that does the same, but overlapping, and ducks the default player while
+# a clip plays. with a mixer, new=True sounds that fit in its cache are mixed instead of using the pool
+#
+# fades (fade_in, fade_out, crossfade, fade_volume) are ramps on a Fader, so they all share one thread
+# prefetch(paths) warms media in the background (see Prefetcher) so the first play is as fast as a repeat
+# loudness is an optional LoudnessStore; every sound's volume is scaled by its gain from there
+class VLCPlayer:
+    def __init__(
+        self,
+        backend=None,
+        voices=8,
+        steal="oldest",
+        clips=None,
+        mixer=None,
+        fader=None,
+        loudness=None,
+    ):
+        self.backend = VLCBackend() if backend is None else backend
+        self.fader = Fader() if fader is None else fader
+        self.prefetcher = Prefetcher(self.warm)
+        self.pool = VoicePool(self.new_player, voices, steal)
+        self.clips = clips
+        self.mixer = mixer
+        self.loudness = loudness
+        self.track_gain = 1.0  # loudness gain of the default player's track
+        self.duck_level = 100  # share of the default player's volume left by ducking
+        if mixer is not None:
+            mixer.on_duck = self.duck
+        self.players = []
+        self.nplayers = 0
+        self.playlist_mode = False
+        self.playlist = None  # iterator of paths to play once the queue is empty
+        self.playlist_next = None  # next path of the playlist, once peeked at
+        self.queue = deque()  # paths to play next, in order
+        self.standby = None  # player with the next track preloaded
+        self.standby_path = None
+        self.volume = 50
+        self.fade = 100  # how far the default player is faded in (0-100)
+        self.fading = []  # players fading out after a crossfade
+        # held while changing players; end of media events come from the backend's thread
+        self.lock = threading.RLock()
+
+    def __call__(self, path, new=False, volume=None, priority=0):
+        # plays path on the default player
+        # if new, plays it on a pooled voice on top of whatever's playing and returns its Voice,
+        # or None if the pool is full of voices with a higher priority
+        # (or the mixer's MixerVoice, where volume is relative to the player's volume)
+
+        gain = self.gain(path)
+        if new and self.mixer is not None:
+            voice = self.mixer.play(path, (100 if volume is None else volume) * gain)
+            if voice is not None:
+                return voice
+
+        with self.lock:
+            if new:
+                volume = self.volume if volume is None else volume
+                voice = self.pool.play(
+                    path, min(int(volume * gain), MAX_VOLUME), priority
+                )
+                if voice is not None:
+                    print(f"Playing {os.path.basename(path)}".encode("utf8"))
+                return voice
+
+            if not self.nplayers:
+                player = self.new_player()
+                self.players.append(player)
+                self.nplayers += 1
+            else:
+                player = self.players[0]
+
+            self.track_gain = gain
+            player.set_volume(self.player_volume())
+            player.load(path)
+            print(f"Playing {os.path.basename(path)}".encode("utf8"))
+            player.play()
+
+    def play_clip(self, path):
+        # plays path from the clip cache, skipping libvlc entirely
+        # returns False if there's no clip player or path is too long to cache
+        if self.mixer is not None:
+            return self.mixer.play(path, 100 * self.gain(path)) is not None
+        if self.clips is None:
+            return False
+        return self.clips.play(path, self.gain(path))
+
+    def prefetch(self, paths):
+        # warms paths in the background, dropping whatever the last prefetch hadn't got to
+        self.prefetcher.prefetch(paths)
+
+    def warm(self, path):
+        # decodes path into the clip cache if it's short enough, else has the backend parse it
+        cache = None
+        if self.mixer is not None:
+            cache = self.mixer.cache
+        elif self.clips is not None:
+            cache = self.clips.cache
+        if cache is not None and cache.get(path) is not None:
+            return
+        self.backend.prefetch(path)
+
+    def new_player(self):
+        player = self.backend.new_player()
+        player.on_end = self.on_end
+        return player
+
+    def stop(self):
+        with self.lock:
+            for player in self.players:
+                player.stop()
+            self.pool.stop()
+            if self.clips is not None:
+                self.clips.stop()
+            if self.mixer is not None:
+                self.mixer.stop()
+            for player in self.fading:
+                self.fader.cancel(player)
+                player.stop()
+            self.fading = []
+
+    def reset(self):
+        with self.lock:
+            self.stop()
+            self.fader.cancel((self, "fade"))
+            self.fade = 100
+            self.players = []
+            self.nplayers = 0
+            self.playlist_mode = False
+            self.playlist = None
+            self.playlist_next = None
+            self.queue.clear()
+            self.standby_path = None  # standby player is kept for the next playlist
+
+    def play_playlist(self, paths):
+        # plays paths (any iterable, e.g. a Library shuffle) one after another
+        # each track is started by the end of media event of the last one, so there's no polling
+        with self.lock:
+            self.reset()
+            self.playlist_mode = True
+            self.playlist = iter(paths)
+            self.next()
+
+    def enqueue(self, path):
+        # plays path after the current track (and anything enqueued before it), ahead of the playlist
+        with self.lock:
+            self.queue.append(path)
+            self.playlist_mode = True
+            self.preload_next()
+
+    def peek(self):
+        # returns the path that will play next, or None if there isn't one
+        with self.lock:
+            if self.queue:
+                return self.queue[0]
+            if self.playlist_next is None and self.playlist is not None:
+                self.playlist_next = next(self.playlist, None)
+                if self.playlist_next is None:
+                    self.playlist = None
+            return self.playlist_next
+
+    def next(self):
+        # skips to the next track and returns its path
+        # resets the player and returns None once there's nothing left
+        with self.lock:
+            if not self.playlist_mode:
+                return None
+            path = self.peek()
+            if path is None:
+                self.reset()
+                return None
+            if self.queue:
+                self.queue.popleft()
+            else:
+                self.playlist_next = None
+
+            if self.standby is not None and self.standby_path == path:
+                # hand off to the preloaded player. the old one is the new standby
+                player, self.standby = self.standby, self.default_player()
+                if self.standby is not None:
+                    self.standby.stop()
+                    self.players[0] = player
+                else:
+                    self.players.append(player)
+                    self.nplayers += 1
+                self.track_gain = self.gain(path)
+                player.set_volume(self.player_volume())
+                print(f"Playing {os.path.basename(path)}".encode("utf8"))
+                player.play()
+            else:
+                self(path)
+
+            self.standby_path = None
+            self.preload_next()
+            return path
+
+    def preload_next(self):
+        path = self.peek()
+        if path is None or path == self.standby_path:
+            return
+        if self.standby is None:
+            self.standby = self.new_player()
+        self.standby.preload(path)
+        self.standby_path = path
+
+    def on_end(self, player):
+        with self.lock:
+            if self.playlist_mode and player is self.default_player():
+                self.next()
+
+    def playing(self, player=None):
+        # checks if the given player is playing,
+        # if none given, checks the default player
+
+        if self.nplayers == 0:
+            return False
+        elif player is None:
+            player = self.default_player()
+        return player.playing()
+
+    def default_player(self):
+        # returns the default player if it exists, else None
+        if not self.nplayers:
+            return None
+        return self.players[0]
+
+    def toggle_pause(self):
+        # works only for default player
+
+        with self.lock:
+            if not self.nplayers:
+                return
+
+            player = self.default_player()
+            if self.playing(player):
+                player.pause()
+            else:
+                player.play()
+
+    def set_volume(self, value):
+        # works only for default player (and the mixer)
+        self.volume = value
+        if self.mixer is not None:
+            self.mixer.set_volume(value)
+        if self.clips is not None:
+            self.clips.set_volume(value)
+
+        if not self.nplayers:
+            return
+
+        player = self.default_player()
+        player.set_volume(self.player_volume())
+
+    def gain(self, path):
+        # loudness normalization gain of path (1 if it hasn't been measured)
+        if self.loudness is None:
+            return 1.0
+        return self.loudness.gain(path)
+
+    def player_volume(self):
+        # volume of the default player, after loudness gain, fading and ducking
+        volume = self.volume * self.track_gain * self.fade / 100
+        volume *= self.duck_level / 100
+        return min(int(volume), MAX_VOLUME)
+
+    def set_fade(self, value):
+        self.fade = value
+        player = self.default_player()
+        if player is not None:
+            player.set_volume(self.player_volume())
+
+    def fade_volume(self, value, seconds):
+        # like set_volume, but gets there gradually
+        self.fader.ramp((self, "volume"), self.set_volume, self.volume, value, seconds)
+
+    def fade_in(self, seconds):
+        # fades the default player in, resuming it (from silence) if it's paused
+        with self.lock:
+            player = self.default_player()
+            if player is None:
+                return
+            if not player.playing():
+                self.set_fade(0)
+                player.play()
+            self.fader.ramp((self, "fade"), self.set_fade, self.fade, 100, seconds)
+
+    def fade_out(self, seconds, stop=False):
+        # fades the default player out, then pauses it (fade_in or toggle_pause resumes it)
+        # if stop, resets the player instead, like StopMedia
+        with self.lock:
+            if self.default_player() is None:
+                return
+            done = self.reset if stop else self.faded_out
+            self.fader.ramp((self, "fade"), self.set_fade, self.fade, 0, seconds, done)
+
+    def faded_out(self):
+        with self.lock:
+            player = self.default_player()
+            if player is not None:
+                player.pause()
+            self.set_fade(100)
+
+    def crossfade(self, seconds):
+        # skips to the next track like next(), fading the current one out while the next fades in
+        with self.lock:
+            old = self.default_player()
+            if old is None or not self.playlist_mode or self.peek() is None:
+                return self.next()
+
+            # the old player plays out on its own; the empty one in its place becomes the standby
+            self.players[0] = self.new_player()
+            self.fading.append(old)
+            self.fader.ramp(
+                old,
+                old.set_volume,
+                self.player_volume(),
+                0,
+                seconds,
+                partial(self.crossfaded, old),
+            )
+
+            self.fader.cancel((self, "fade"))
+            self.fade = 0
+            path = self.next()
+            self.fader.ramp((self, "fade"), self.set_fade, 0, 100, seconds)
+            return path
+
+    def crossfaded(self, player):
+        with self.lock:
+            if player in self.fading:
+                self.fading.remove(player)
+                player.stop()
+
+    def duck(self, ducked):
+        # called by the mixer (on its duck thread) when clips start and stop playing
+        level = int(self.mixer.duck * 100) if ducked else 100
+        self.fader.ramp(
+            (self, "duck"), self.set_duck, self.duck_level, level, DUCK_SECONDS
+        )
+
+    def set_duck(self, value):
+        self.duck_level = value
+        player = self.default_player()
+        if player is not None:
+            player.set_volume(self.player_volume())
+
+
+class Prefetcher:
+    """
+    runs warm(path) for each path on a background thread
+
+    prefetch(paths) replaces the paths still waiting, so switching views cancels whatever
+    the old view hadn't warmed yet. a path that's being warmed finishes
+    """
+
+    def __init__(self, warm):
+        self.warm = warm
+        self.paths = deque()
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(
+            target=self.run, daemon=True, name="Media Prefetch"
+        )
+        self.thread.start()
+
+    def prefetch(self, paths):
+        with self.cond:
+            self.paths = deque(dict.fromkeys(paths))  # drop duplicates, keep order
+            self.cond.notify()
+
+    def cancel(self):
+        with self.cond:
+            self.paths.clear()
+
+    def pending(self):
+        return len(self.paths)
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.paths:
+                    self.cond.wait()
+                path = self.paths.popleft()
+            self.warm(path)
+
+
+class VoicePool:
+    """
+    fixed number of players for overlapping sounds
+
+    a sound goes to an idle voice if there is one. once all are busy, one is stolen:
+        oldest      the voice that started first
+        quietest    the voice with the lowest volume
+        priority    the voice with the lowest priority (oldest first). a sound is dropped
+                    rather than steal from a voice with a higher priority than its own
+    """
+
+    def __init__(self, new_player, size=8, policy="oldest"):
+        if policy not in STEAL_POLICIES:
+            raise ValueError(
+                f"unknown steal policy {policy!r}, expected one of {STEAL_POLICIES}"
+            )
+        self.new_player = new_player
+        self.size = size
+        self.policy = policy
+        self.slots = []
+        self.count = 0  # number of sounds played, to tell which voice is oldest
+
+    def play(self, path, volume, priority=0):
+        # returns Voice, or None if the sound was dropped
+        slot = self.free_slot(priority)
+        if slot is None:
+            return None
+
+        self.count += 1
+        slot.generation += 1  # invalidates the old Voice handle if this was stolen
+        slot.started = self.count
+        slot.volume = volume
+        slot.priority = priority
+
+        slot.player.stop()
+        slot.player.set_volume(volume)
+        slot.player.load(path)
+        slot.player.play()
+        return Voice(slot)
+
+    def free_slot(self, priority):
+        for slot in self.slots:
+            if not slot.player.playing():
+                return slot
+        if len(self.slots) < self.size:
+            slot = VoiceSlot(self.new_player())
+            self.slots.append(slot)
+            return slot
+
+        if self.policy == "oldest":
+            return min(self.slots, key=lambda slot: slot.started)
+        if self.policy == "quietest":
+            return min(self.slots, key=lambda slot: (slot.volume, slot.started))
+        victim = min(self.slots, key=lambda slot: (slot.priority, slot.started))
+        return victim if victim.priority <= priority else None
+
+    def stop(self):
+        for slot in self.slots:
+            slot.player.stop()
+
+    def active(self):
+        # returns number of voices playing
+        return sum(slot.player.playing() for slot in self.slots)
+
+
+class VoiceSlot:
+    def __init__(self, player):
+        self.player = player
+        self.generation = 0
+        self.started = 0
+        self.volume = 0
+        self.priority = 0
+
+
+class Voice:
+    """
+    handle to a sound playing on a VoicePool voice
+
+    once the voice is reused for another sound, the handle does nothing
+    """
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.generation = slot.generation
+
+    def active(self):
+        return self.slot.generation == self.generation
+
+    def playing(self):
+        return self.active() and self.slot.player.playing()
+
+    def set_volume(self, value):
+        if self.active():
+            self.slot.volume = value
+            self.slot.player.set_volume(value)
+
+    def stop(self):
+        if self.active():
+            self.slot.player.stop()
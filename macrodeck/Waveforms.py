@@ -0,0 +1,128 @@
+import hashlib
+import os
+import threading
+from collections import deque
+
+from PIL import Image
+
+try:
+    import numpy as np
+    import soundfile
+
+    HAS_WAVEFORMS = True
+except (ModuleNotFoundError, OSError):
+    HAS_WAVEFORMS = False
+
+# waveform thumbnails for media buttons: one min/max peak per pixel column, drawn as vertical bars
+# rendering means decoding the whole file, so thumbnails are saved as pngs and only redrawn when
+# the file changes
+
+WAVEFORM_COLOR = (255, 255, 255, 200)
+READ_COLUMNS = 256  # pixel columns' worth of audio decoded at a time
+
+
+class WaveformCache:
+    """
+    renders waveform thumbnails of size (width, height) on a background thread,
+    keeping them as pngs in folder
+
+    request(paths, callback) calls callback(path, image) from that thread as each thumbnail is
+    ready (image is a PIL Image, or None if path can't be decoded). a new request replaces
+    the paths still waiting, so switching views drops the old view's thumbnails
+    """
+
+    def __init__(self, folder="waveforms", size=(23, 23), color=WAVEFORM_COLOR):
+        self.folder = folder
+        self.size = size
+        self.color = color
+        self.pending = deque()  # (path, callback)
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True, name="Waveforms")
+        self.thread.start()
+        os.makedirs(folder, exist_ok=True)
+
+    def filename(self, path):
+        # returns where path's thumbnail is cached, or None if path doesn't exist
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        key = f"{path}\0{mtime}\0{self.size[0]}x{self.size[1]}"
+        digest = hashlib.sha1(key.encode("utf8")).hexdigest()
+        return os.path.join(self.folder, digest + ".png")
+
+    def get(self, path):
+        # returns path's thumbnail, rendering it if it isn't cached; None if it can't be decoded
+        filename = self.filename(path)
+        if filename is None:
+            return None
+        try:
+            with Image.open(filename) as image:
+                image.load()
+                return image
+        except (FileNotFoundError, OSError):
+            pass
+
+        try:
+            image = render(path, self.size, self.color)
+        except (RuntimeError, OSError):  # soundfile can't read it
+            return None
+        image.save(filename)
+        return image
+
+    def request(self, paths, callback):
+        with self.cond:
+            self.pending = deque((path, callback) for path in dict.fromkeys(paths))
+            self.cond.notify()
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.pending:
+                    self.cond.wait()
+                path, callback = self.pending.popleft()
+            callback(path, self.get(path))
+
+
+# helper functions
+
+
+def render(path, size, color=WAVEFORM_COLOR):
+    # returns an RGBA image of path's waveform, scaled so its loudest peak fills the height
+    width, height = size
+    mins, maxs = peaks(path, width)
+    if not len(mins):
+        mins = maxs = np.zeros(width, dtype=np.float32)
+
+    # stretch short files out to the full width
+    columns = np.arange(width) * len(mins) // width
+    mins, maxs = mins[columns], maxs[columns]
+    scale = max(float(maxs.max()), float(-mins.min()))
+    if scale > 0:
+        mins, maxs = mins / scale, maxs / scale
+
+    center = (height - 1) / 2
+    top = np.rint(center - maxs * center)
+    bottom = np.rint(center - mins * center)
+    rows = np.arange(height)[:, None]
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    pixels[(rows >= top) & (rows <= bottom)] = color
+    return Image.fromarray(pixels, "RGBA")
+
+
+def peaks(path, width):
+    # returns (mins, maxs): the lowest and highest sample of each of at most width columns
+    with soundfile.SoundFile(path) as f:
+        column = max(1, -(-f.frames // width))  # frames per column, rounded up
+        mins = []
+        maxs = []
+        for data in f.blocks(column * READ_COLUMNS, dtype="float32", always_2d=True):
+            mono = data.mean(axis=1)
+            if len(mono) % column:
+                mono = np.pad(mono, (0, column - len(mono) % column), mode="edge")
+            mono = mono.reshape(-1, column)
+            mins.append(mono.min(axis=1))
+            maxs.append(mono.max(axis=1))
+    if not mins:
+        return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+    return np.concatenate(mins), np.concatenate(maxs)
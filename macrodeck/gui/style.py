@@ -1,17 +1,17 @@
-BC_DEFAULT = "#565B5E"
-BC_ACTIVE = "#FFFFFF"
-FC_EMPTY = "#1E1E1E"
-FC_DEFAULT = "#0494D9"
-# FC_DEFAULT2 = '#4048ff'
-FC_DEFAULT2 = "#3941e7"
-
-TOGGLE_ON = "#ff3553"
-TOGGLE_OFF = "#3d3b3b"
-
-WRAPLEN = 65
-
-ICON_SIZE = (23, 23)
-ICON_SIZE_WIDE = (26, 23)
-
-XPAD = 5
-YPAD = 5
+BC_DEFAULT = "#565B5E"
+BC_ACTIVE = "#FFFFFF"
+FC_EMPTY = "#1E1E1E"
+FC_DEFAULT = "#0494D9"
+# FC_DEFAULT2 = '#4048ff'
+FC_DEFAULT2 = "#3941e7"
+
+TOGGLE_ON = "#ff3553"
+TOGGLE_OFF = "#3d3b3b"
+
+WRAPLEN = 65
+
+ICON_SIZE = (23, 23)
+ICON_SIZE_WIDE = (26, 23)
+
+XPAD = 5
+YPAD = 5